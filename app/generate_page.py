@@ -2,13 +2,21 @@
 """Generate home page with app list from Docker labels and Traefik config."""
 
 import argparse
+import atexit
+import functools
+import gzip
 import json
 import os
+import re
+import shutil
+import signal
 import sys
 import tempfile
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 try:
     import docker
@@ -26,29 +34,268 @@ except ImportError:
     import docker  # type: ignore
     import requests  # type: ignore
 
+try:
+    import orjson
+except ImportError:
+    # Optional: fall back to the stdlib json module
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None
+
+# Shared HTTP session so Traefik API discovery and router fetches reuse
+# keep-alive connections; sized for the concurrent discovery probes
+_SESSION = requests.Session()
+_SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0))
+atexit.register(_SESSION.close)
+
+# Traefik router labels on containers: traefik.http.routers.<name>.(rule|entrypoints)
+ROUTER_LABEL_RE = re.compile(r"^traefik\.http\.routers\.([^.]+)\.(rule|entrypoints)$")
+
+# One (optionally quoted) argument of a Host()/HostRegexp() matcher; quoted
+# arguments may contain parentheses and commas (e.g. `{sub:(a|b)}.example.com`)
+_HOST_ARG = r"`([^`]*)`|'([^']*)'|\"([^\"]*)\"|([^`'\",()\s]+)"
+HOST_ARG_RE = re.compile(_HOST_ARG)
+
+# Host(`example.com`), Host(`a.com`, `b.com`) and HostRegexp(`{sub:[a-z]+}.example.com`)
+# matchers in router rules; the second group is the whole argument list
+HOST_RULE_RE = re.compile(
+    rf"Host(Regexp)?\(\s*((?:{_HOST_ARG})(?:\s*,\s*(?:{_HOST_ARG}))*)\s*\)"
+)
+
+# str.translate() table dropping the braces of HostRegexp variables
+_STRIP_BRACES = str.maketrans("", "", "{}")
+
+# Entrypoint names served over TLS (e.g. "websecure", "https"), matched case-insensitively;
+# routers from the Traefik API accept any "secure" entrypoint, Docker labels only these two
+SECURE_ENTRYPOINT_RE = re.compile(r"secure|https", re.IGNORECASE)
+LABEL_SECURE_ENTRYPOINT_RE = re.compile(r"websecure|https", re.IGNORECASE)
+
+# External app labels on the traefik-home container: traefik-home.app.<name>.<attribute>,
+# optionally with a suffix so an attribute can be repeated (e.g. .url.1, .url.2)
+APP_LABEL_RE = re.compile(r"^traefik-home\.app\.([^.]+)\.([^.]+)(?:\..*)?$")
+
+
+def _bool(value: Optional[str]) -> bool:
+    """Parse a label or environment variable value as a boolean ("true", any case)."""
+    return value.lower() == "true" if value else False
+
+
+# External app label attribute -> (config key, value parser); ".url" is handled separately
+EXTERNAL_APP_ATTRIBUTES = {
+    "enable": ("enabled", _bool),
+    "alias": ("alias", str),
+    "icon": ("icon", str),
+    "admin": ("is_admin", _bool),
+    "category": ("category", sys.intern),  # few distinct values shared by many apps
+    "description": ("description", str),
+}
+
+# Shared read-only default for missing metadata/override entries
+_EMPTY: Dict[str, Any] = {}
+
+# Templates may contain this marker to receive apps.json inline
+APPS_JSON_PLACEHOLDER = b"{{APPS_JSON}}"
+
+# Docker events that change which apps are shown (used by --watch mode)
+WATCH_EVENTS = ["start", "die", "destroy", "update", "rename"]
+
+# Parsed container labels keyed by container ID: (labels, parse result)
+_container_cache: Dict[str, Tuple[Dict[str, str], Any]] = {}
+
+
+def _full_fsync(fd: int) -> None:
+    """Flush a file through the drive cache on macOS, where fsync() stops at the OS."""
+    try:
+        fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+    except OSError:
+        os.fsync(fd)
+
+
+# Flush file data without forcing an inode metadata journal commit; the
+# rename that follows is what publishes the file. Falls back where unavailable.
+if hasattr(os, "fdatasync"):
+    _fdatasync = os.fdatasync
+elif fcntl is not None and hasattr(fcntl, "F_FULLFSYNC"):
+    _fdatasync = _full_fsync
+else:
+    _fdatasync = os.fsync
+
 
-def atomic_write(filepath: str, content: str, mode: int = 0o644) -> None:
+def atomic_write(filepath: str, content: Union[str, bytes], mode: int = 0o644) -> None:
     """
     Write content to file atomically using a temp file and rename.
     
     Args:
         filepath: Target file path
-        content: Content to write
+        content: Content to write (text or already-encoded bytes)
         mode: File permissions (default: 0o644)
     """
+    atomic_write_batch({filepath: content}, mode)
+
+
+def atomic_write_batch(files: Dict[str, Union[str, bytes]], mode: int = 0o644) -> None:
+    """
+    Write several files atomically, sharing the durability barriers.
+    
+    All temp files are written first, then fdatasynced concurrently and
+    renamed into place, and finally each parent directory is fsynced once so
+    the renames themselves are durable.
+    
+    Args:
+        files: Mapping of target file path to content (text or bytes)
+        mode: File permissions (default: 0o644)
+    """
+    staged = []  # (fd, temp_path, filepath); fd is None once closed
+    try:
+        for filepath, content in files.items():
+            filepath_obj = Path(filepath)
+            # Encode once and write raw bytes, bypassing the buffered text layer
+            data = content.encode("utf-8") if isinstance(content, str) else content
+            # Create temp file in same directory to ensure same filesystem
+            fd, temp_path = tempfile.mkstemp(
+                dir=filepath_obj.parent,
+                prefix=f".{filepath_obj.name}.",
+                suffix=".tmp"
+            )
+            staged.append([fd, temp_path, filepath])
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            os.chmod(temp_path, mode)
+        
+        if len(staged) > 1:
+            # fdatasync releases the GIL, so the device flushes can overlap
+            with ThreadPoolExecutor(max_workers=len(staged)) as executor:
+                list(executor.map(_fdatasync, [entry[0] for entry in staged]))
+        elif staged:
+            _fdatasync(staged[0][0])
+        
+        for entry in staged:
+            os.close(entry[0])
+            entry[0] = None
+        
+        for entry in staged:
+            # Atomic rename
+            os.replace(entry[1], entry[2])
+            entry[1] = None
+    except Exception:
+        # Clean up temp files on error
+        for fd, temp_path, _ in staged:
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+        raise
+    
+    for directory in dict.fromkeys(str(Path(filepath).parent) for filepath in files):
+        fsync_directory(directory)
+
+
+def fsync_directory(directory: str) -> None:
+    """Flush directory entries (e.g. renames) to disk; a no-op where unsupported."""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+@functools.lru_cache(maxsize=4)
+def gzip_static(data: bytes) -> bytes:
+    """
+    Precompress a file for nginx's gzip_static.
+    
+    The gzip header timestamp is zeroed so identical input always compresses
+    to identical bytes, letting unchanged .gz files skip their rewrite too.
+    
+    Args:
+        data: Uncompressed file content
+        
+    Returns:
+        gzip-compressed content
+    """
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def file_has_content(filepath: str, data: bytes) -> bool:
+    """
+    Check whether a file already holds exactly the given bytes.
+    
+    The size is compared first so most changed files are rejected with a
+    single stat; only same-size files are read back and compared.
+    
+    Args:
+        filepath: File to check
+        data: Expected content
+        
+    Returns:
+        True if the file exists and its content equals data
+    """
+    try:
+        if os.stat(filepath).st_size != len(data):
+            return False
+        with open(filepath, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def atomic_link(src_path: str, filepath: str, mode: int = 0o644) -> None:
+    """
+    Atomically replace filepath with a hardlink to an already-written file.
+    
+    If hardlinks are not supported (e.g. some network or overlay filesystems),
+    the file is copied kernel-side (sendfile/copy_file_range via shutil)
+    instead of being re-encoded and re-written from Python.
+    
+    Args:
+        src_path: Existing file with the desired content
+        filepath: Target file path
+        mode: File permissions for the copy fallback (default: 0o644)
+    """
     filepath_obj = Path(filepath)
-    # Create temp file in same directory to ensure same filesystem
+    temp_path = str(filepath_obj.parent / f".{filepath_obj.name}.{os.getpid()}.lnk.tmp")
+    try:
+        os.link(src_path, temp_path)
+        os.replace(temp_path, filepath)
+        return
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+    
     fd, temp_path = tempfile.mkstemp(
         dir=filepath_obj.parent,
         prefix=f".{filepath_obj.name}.",
         suffix=".tmp"
     )
     try:
-        with os.fdopen(fd, 'w') as f:
-            f.write(content)
+        os.close(fd)
+        shutil.copyfile(src_path, temp_path)
+        fd = os.open(temp_path, os.O_RDONLY)
+        try:
+            _fdatasync(fd)
+        finally:
+            os.close(fd)
         os.chmod(temp_path, mode)
-        # Atomic rename
-        os.rename(temp_path, filepath)
+        os.replace(temp_path, filepath)
     except Exception:
         # Clean up temp file on error
         try:
@@ -72,20 +319,24 @@ def discover_traefik_api() -> Optional[str]:
             print(f"Using Traefik API from env: {env_url}")
             return env_url.rstrip("/")
     
-    # Try common container DNS names
-    for host in ["traefik", "traefik-proxy", "reverse-proxy"]:
-        for port in [8080, 8081]:
-            candidate = f"http://{host}:{port}"
-            if test_traefik_endpoint(candidate):
+    # Try common container DNS names, then localhost
+    candidates = [
+        f"http://{host}:{port}"
+        for host in ["traefik", "traefik-proxy", "reverse-proxy", "localhost"]
+        for port in [8080, 8081]
+    ]
+    
+    # Probe all candidates at once (unreachable ones each cost a full timeout),
+    # but still prefer earlier candidates when several respond
+    executor = ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        futures = [executor.submit(test_traefik_endpoint, candidate) for candidate in candidates]
+        for candidate, future in zip(candidates, futures):
+            if future.result():
                 print(f"Discovered Traefik API at: {candidate}")
                 return candidate
-    
-    # Try localhost
-    for port in [8080, 8081]:
-        candidate = f"http://localhost:{port}"
-        if test_traefik_endpoint(candidate):
-            print(f"Discovered Traefik API at: {candidate}")
-            return candidate
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     
     return None
 
@@ -96,12 +347,12 @@ def test_traefik_endpoint(base_url: str, timeout: float = 2.0) -> bool:
         return False
     base_url = base_url.rstrip("/")
     try:
-        resp = requests.get(f"{base_url}/api/http/routers", timeout=timeout)
+        resp = _SESSION.get(f"{base_url}/api/http/routers", timeout=timeout)
         return resp.status_code == 200
     except Exception:
         pass
     try:
-        resp = requests.get(f"{base_url}/api/routers", timeout=timeout)
+        resp = _SESSION.get(f"{base_url}/api/routers", timeout=timeout)
         return resp.status_code == 200
     except Exception:
         pass
@@ -121,28 +372,30 @@ def fetch_traefik_routers(traefik_api: Optional[str]) -> Dict[str, List[str]]:
     Returns:
         Dictionary mapping service/router names to URLs
     """
-    service_urls = {}
+    # Service/router name -> ordered set of URLs (dict keys preserve insertion order)
+    service_urls: Dict[str, Dict[str, None]] = {}
     
     if not traefik_api:
-        return service_urls
+        return {}
     
+    base_url = traefik_api.rstrip("/")
     routers = None
     try:
-        resp = requests.get(f"{traefik_api.rstrip('/')}/api/http/routers", timeout=5)
+        resp = _SESSION.get(f"{base_url}/api/http/routers", timeout=5)
         resp.raise_for_status()
-        routers = resp.json()
+        routers = load_json(resp.content)
     except Exception as e:
         print(f"Warning: Could not fetch Traefik routers: {e}", file=sys.stderr)
         try:
-            resp = requests.get(f"{traefik_api.rstrip('/')}/api/routers", timeout=5)
+            resp = _SESSION.get(f"{base_url}/api/routers", timeout=5)
             resp.raise_for_status()
-            routers = resp.json()
+            routers = load_json(resp.content)
         except Exception as e2:
             print(f"Warning: Fallback routers endpoint also failed: {e2}", file=sys.stderr)
-            return service_urls
+            return {}
     
     if not routers:
-        return service_urls
+        return {}
     
     # Handle both list and dict response formats
     router_items = []
@@ -170,12 +423,8 @@ def fetch_traefik_routers(traefik_api: Optional[str]) -> Dict[str, List[str]]:
             
             # Determine protocol from entrypoints
             protocol = "http"
-            if entrypoints:
-                for ep in entrypoints:
-                    ep_lower = str(ep).lower()
-                    if "secure" in ep_lower or "https" in ep_lower or "websecure" in ep_lower:
-                        protocol = "https"
-                        break
+            if any(SECURE_ENTRYPOINT_RE.search(str(ep)) for ep in entrypoints):
+                protocol = "https"
             
             # Parse Host() rules to get URLs
             urls = parse_traefik_rule(rule, protocol=protocol)
@@ -184,7 +433,7 @@ def fetch_traefik_routers(traefik_api: Optional[str]) -> Dict[str, List[str]]:
                 continue
             
             # Get service name without provider suffix
-            svc_norm = service.split("@")[0] if isinstance(service, str) else str(service)
+            svc_norm = service.partition("@")[0] if isinstance(service, str) else str(service)
             
             # Skip internal router artifacts
             if svc_norm.lower() == "router" or (isinstance(rname, str) and rname.lower() == "router"):
@@ -192,137 +441,257 @@ def fetch_traefik_routers(traefik_api: Optional[str]) -> Dict[str, List[str]]:
             
             # Store under service name
             if svc_norm:
-                if svc_norm not in service_urls:
-                    service_urls[svc_norm] = []
-                service_urls[svc_norm].extend(urls)
+                service_urls.setdefault(svc_norm, {}).update(dict.fromkeys(urls))
             
             # Also store under full router name (e.g., "omv@file")
             if rname:
-                if rname not in service_urls:
-                    service_urls[rname] = []
-                service_urls[rname].extend(urls)
+                service_urls.setdefault(rname, {}).update(dict.fromkeys(urls))
                 
                 # Store under router base name as well (e.g., "omv" from "omv@file")
-                rname_base = rname.split("@")[0] if "@" in rname else rname
+                rname_base = rname.partition("@")[0]
                 if rname_base and rname_base != svc_norm:
-                    if rname_base not in service_urls:
-                        service_urls[rname_base] = []
-                    service_urls[rname_base].extend(urls)
+                    service_urls.setdefault(rname_base, {}).update(dict.fromkeys(urls))
         except Exception as e:
             print(f"Warning: Error parsing router {rname}: {e}", file=sys.stderr)
     
-    # Remove duplicates
-    for key in service_urls:
-        service_urls[key] = list(dict.fromkeys(service_urls[key]))
-    
-    return service_urls
+    # URLs were accumulated as ordered sets (dict keys), so they are already unique
+    return {key: list(urls) for key, urls in service_urls.items()}
 
 
-def build_service_url_map(docker_client: docker.DockerClient, traefik_api: Optional[str] = None) -> tuple[Dict[str, List[str]], Dict[str, Dict[str, Any]]]:
+def list_containers(docker_client: docker.DockerClient) -> List[Dict[str, Any]]:
     """
-    Build a map of service names to their URLs and metadata from Docker container labels
-    AND from Traefik API (for file provider, kubernetes, etc.).
+    List running containers with a single Docker API call.
+    
+    Uses the low-level /containers/json endpoint, which already includes
+    names and labels, so no per-container inspect round-trips are needed.
     
     Args:
         docker_client: Docker client instance
-        traefik_api: Optional Traefik API base URL
         
     Returns:
-        Tuple of (service_urls dict, service_metadata dict)
+        List of raw container dictionaries (empty list on error)
     """
-    service_urls = {}
-    service_metadata = {}
-    
-    # First, fetch routers from Traefik API (includes file provider, etc.)
-    if traefik_api:
-        print(f"Fetching routers from Traefik API: {traefik_api}")
-        traefik_urls = fetch_traefik_routers(traefik_api)
-        print(f"Found {len(traefik_urls)} services from Traefik API")
-        service_urls.update(traefik_urls)
-    
-    # Then, get additional info from Docker containers
     try:
-        containers = docker_client.containers.list()
+        return docker_client.api.containers(all=False)
     except Exception as e:
         print(f"Warning: Could not list Docker containers: {e}", file=sys.stderr)
-        return service_urls, service_metadata
+        return []
+
+
+def get_container_name(container: Dict[str, Any]) -> str:
+    """Get the container name (without leading slash) from a raw container dict."""
+    names = container.get("Names") or []
+    if names:
+        return names[0].lstrip("/")
+    return container.get("Id", "")[:12]
+
+
+def find_self_container(containers: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Find the traefik-home container in an already-fetched container list.
+    
+    Matches HOSTNAME (the short container ID by default, or a custom hostname
+    equal to the container name) against each container.
     
+    Args:
+        containers: Raw container dictionaries from list_containers()
+        
+    Returns:
+        The traefik-home container dict or None if not found
+    """
+    current_container_id = os.getenv("HOSTNAME")
+    if not current_container_id:
+        return None
     for container in containers:
-        labels = container.labels
+        if (container.get("Id", "").startswith(current_container_id) or
+                get_container_name(container) == current_container_id):
+            return container
+    return None
+
+
+def parse_container_labels(container: Dict[str, Any], labels: Optional[Dict[str, str]] = None) -> Optional[Tuple[str, Dict[str, List[str]], Optional[Dict[str, Any]]]]:
+    """
+    Parse the Traefik router and traefik-home labels of a single container.
+    
+    Args:
+        container: Raw container dictionary from list_containers()
+        labels: Container labels if already extracted (default: read from container)
         
-        # Skip the traefik-home container itself
-        service_name = labels.get("com.docker.compose.service", container.name)
-        if service_name == "traefik-home":
+    Returns:
+        Tuple of (service_name, urls keyed by service/router name, metadata or None),
+        or None for the traefik-home container itself
+    """
+    if labels is None:
+        labels = container.get("Labels") or {}
+    
+    # Skip the traefik-home container itself
+    service_name = labels.get("com.docker.compose.service")
+    if service_name is None:
+        service_name = get_container_name(container)
+    if service_name == "traefik-home":
+        return None
+    
+    service_urls = {}
+    metadata = None
+    
+    # Collect Traefik HTTP router rules and entrypoints, and note whether any
+    # traefik-home.* label is present, in one pass over the labels
+    router_rules = []
+    router_entrypoints = {}
+    has_home_labels = False
+    for key, value in labels.items():
+        # Most labels are neither kind; reject them with cheap prefix checks
+        if not key.startswith("traefik.http.routers."):
+            if not has_home_labels and key.startswith("traefik-home."):
+                has_home_labels = True
+            continue
+        match = ROUTER_LABEL_RE.match(key)
+        if match:
+            router_name, attribute = match.groups()
+            if attribute == "rule":
+                router_rules.append((router_name, value))
+            else:
+                router_entrypoints[router_name] = value
+    
+    # Extract traefik-home specific metadata
+    # Only store metadata if the container has traefik-home labels
+    # This is used to determine which apps to include in the final list
+    if has_home_labels:
+        enable = labels.get("traefik-home.enable", "").lower()
+        metadata = {
+            "icon": labels.get("traefik-home.icon", ""),
+            "alias": labels.get("traefik-home.alias", ""),
+            "hide": _bool(labels.get("traefik-home.hide")),
+            "is_admin": _bool(labels.get("traefik-home.admin")),
+            "enable": enable if enable else "true"  # Default to true if not specified
+        }
+    
+    for router_name, rule in router_rules:
+        # Skip routers with "redirect" in the name (HTTP->HTTPS redirects)
+        if "redirect" in router_name.lower():
             continue
         
-        # Extract traefik-home specific metadata
-        # Check if container has ANY traefik-home labels
-        has_traefik_home_labels = any(k.startswith("traefik-home.") for k in labels.keys())
+        # Determine protocol from entrypoint or assume http
+        protocol = "http"
+        entrypoints = router_entrypoints.get(router_name)
+        if entrypoints and LABEL_SECURE_ENTRYPOINT_RE.search(entrypoints):
+            protocol = "https"
         
-        icon = labels.get("traefik-home.icon", "")
-        alias = labels.get("traefik-home.alias", "")
-        hide = labels.get("traefik-home.hide", "").lower() == "true"
-        is_admin = labels.get("traefik-home.admin", "").lower() == "true"
-        enable = labels.get("traefik-home.enable", "").lower()
+        # Parse Host() or HostRegexp() rules
+        urls = parse_traefik_rule(rule, protocol=protocol)
         
-        # Only store metadata if the container has traefik-home labels
-        # This is used to determine which apps to include in the final list
-        if has_traefik_home_labels and service_name not in service_metadata:
-            service_metadata[service_name] = {
-                "icon": icon,
-                "alias": alias,
-                "hide": hide,
-                "is_admin": is_admin,
-                "enable": enable if enable else "true"  # Default to true if not specified
-            }
+        if urls and service_name:
+            # Store under service name
+            service_urls.setdefault(service_name, []).extend(urls)
+            
+            # Also store under router name for external app matching
+            # (e.g., "omv@docker" if service is "omv")
+            service_urls.setdefault(f"{router_name}@docker", []).extend(urls)
+    
+    return service_name, service_urls, metadata
+
+
+def parse_container_labels_cached(container: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, List[str]], Optional[Dict[str, Any]]]]:
+    """
+    Parse container labels, reusing the previous result while its labels are unchanged.
+    
+    Results are cached by container ID so that in --watch mode only containers
+    touched by a Docker event are re-parsed on regeneration.
+    
+    Args:
+        container: Raw container dictionary from list_containers()
         
-        # Find all Traefik HTTP routers from Docker labels
-        for key, value in labels.items():
-            if key.startswith("traefik.http.routers.") and key.endswith(".rule"):
-                # Extract router name
-                parts = key.split(".")
-                if len(parts) >= 4:
-                    router_name = parts[3]
-                    
-                    # Skip routers with "redirect" in the name (HTTP->HTTPS redirects)
-                    if "redirect" in router_name.lower():
-                        continue
-                    
-                    # Determine protocol from entrypoint or assume http
-                    protocol = "http"
-                    entrypoint_key = f"traefik.http.routers.{router_name}.entrypoints"
-                    if entrypoint_key in labels:
-                        entrypoints = labels[entrypoint_key].lower()
-                        if "websecure" in entrypoints or "https" in entrypoints:
-                            protocol = "https"
-                    
-                    # Parse Host() or HostRegexp() rules
-                    urls = parse_traefik_rule(value, protocol=protocol)
-                    
-                    if urls and service_name:
-                        # Store under service name
-                        if service_name not in service_urls:
-                            service_urls[service_name] = []
-                        service_urls[service_name].extend(urls)
-                        
-                        # Also store under router name for external app matching
-                        # (e.g., "omv@docker" if service is "omv")
-                        router_key = f"{router_name}@docker"
-                        if router_key not in service_urls:
-                            service_urls[router_key] = []
-                        service_urls[router_key].extend(urls)
-    
-    # Remove duplicates while preserving order
-    for service_name in service_urls:
-        seen = set()
-        unique_urls = []
-        for url in service_urls[service_name]:
-            if url not in seen:
-                seen.add(url)
-                unique_urls.append(url)
-        service_urls[service_name] = unique_urls
-    
-    return service_urls, service_metadata
+    Returns:
+        Same as parse_container_labels()
+    """
+    container_id = container.get("Id")
+    labels = container.get("Labels") or {}
+    cached = _container_cache.get(container_id) if container_id else None
+    if cached is not None and cached[0] == labels:
+        return cached[1]
+    
+    parsed = parse_container_labels(container, labels)
+    if container_id:
+        _container_cache[container_id] = (labels, parsed)
+    return parsed
+
+
+def build_service_url_map(containers: List[Dict[str, Any]], traefik_api: Optional[str] = None) -> tuple[Dict[str, List[str]], Dict[str, Dict[str, Any]]]:
+    """
+    Build a map of service names to their URLs and metadata from Docker container labels
+    AND from Traefik API (for file provider, kubernetes, etc.).
+    
+    Args:
+        containers: Raw container dictionaries from list_containers()
+        traefik_api: Optional Traefik API base URL
+        
+    Returns:
+        Tuple of (service_urls dict, service_metadata dict)
+    """
+    # Service name -> ordered set of URLs (dict keys preserve insertion order)
+    service_urls: Dict[str, Dict[str, None]] = {}
+    service_metadata = {}
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Fetch routers from Traefik API (includes file provider, etc.) in the
+        # background while the container labels are parsed
+        traefik_future = None
+        if traefik_api:
+            print(f"Fetching routers from Traefik API: {traefik_api}")
+            traefik_future = executor.submit(fetch_traefik_routers, traefik_api)
+        
+        parsed_containers = [parse_container_labels_cached(container) for container in containers]
+        
+        # Traefik API routers come first, then additional info from Docker containers
+        if traefik_future is not None:
+            traefik_urls = traefik_future.result()
+            print(f"Found {len(traefik_urls)} services from Traefik API")
+            for key, urls in traefik_urls.items():
+                service_urls[key] = dict.fromkeys(urls)
+    
+    for parsed in parsed_containers:
+        if parsed is None:
+            continue
+        service_name, container_urls, metadata = parsed
+        
+        if metadata is not None and service_name not in service_metadata:
+            service_metadata[service_name] = metadata
+        
+        for key, urls in container_urls.items():
+            service_urls.setdefault(key, {}).update(dict.fromkeys(urls))
+    
+    # URLs were accumulated as ordered sets (dict keys), so they are already unique
+    return {name: list(urls) for name, urls in service_urls.items()}, service_metadata
+
+
+def parse_traefik_hosts(rule: str) -> List[str]:
+    """
+    Extract unique hostnames from a Traefik rule, in order of appearance.
+    
+    Args:
+        rule: Traefik rule string (e.g., "Host(`example.com`) || Host(`www.example.com`)")
+        
+    Returns:
+        List of hostnames
+    """
+    # Path/method-only rules are common; skip the regex scan for them
+    if "Host" not in rule:
+        return []
+    
+    hosts = {}
+    
+    for match in HOST_RULE_RE.finditer(rule):
+        is_regexp = match.group(1)
+        # Traefik v2 allows several hosts per matcher: Host(`a.com`, `b.com`)
+        for arg in HOST_ARG_RE.finditer(match.group(2)):
+            host = arg.group(arg.lastindex).strip()
+            if is_regexp:
+                # For regexp, take as-is but drop the variable braces
+                host = host.translate(_STRIP_BRACES).strip()
+            if host:
+                hosts[host] = None
+    
+    return list(hosts)
 
 
 def parse_traefik_rule(rule: str, protocol: str = "http") -> List[str]:
@@ -336,58 +705,136 @@ def parse_traefik_rule(rule: str, protocol: str = "http") -> List[str]:
     Returns:
         List of URLs with specified protocol
     """
-    urls = []
+    # Format URLs only after duplicate hosts have been dropped
+    return [f"{protocol}://{host}" for host in parse_traefik_hosts(rule)]
+
+
+def dump_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data as JSON, using orjson when it is installed.
+    
+    Args:
+        data: JSON-serializable data
+        pretty: Indent the output for human readers (default: compact)
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    # default=str keeps generation working if a non-JSON value slips into the data
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def load_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text, using orjson when it is installed.
     
-    # Split by OR operators
-    parts = rule.replace("||", "|").split("|")
+    Args:
+        data: JSON document (bytes are decoded as UTF-8)
+        
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_apps_json(generated: str, config: Dict[str, Any], apps: List[Dict[str, Any]], pretty: bool = False) -> bytes:
+    """
+    Serialize the apps.json document.
     
-    for part in parts:
-        part = part.strip()
+    Args:
+        generated: ISO-8601 generation timestamp
+        config: Page configuration from get_config_from_env_and_labels()
+        apps: App list from build_app_list()
+        pretty: Indent the output for human readers (default: compact)
         
-        # Extract Host() patterns
-        if "Host(" in part:
-            # Find content between Host( and )
-            start = part.find("Host(") + 5
-            end = part.find(")", start)
-            if end > start:
-                host = part[start:end].strip("`").strip("'").strip('"')
-                # Build full URL with specified protocol
-                urls.append(f"{protocol}://{host}")
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return dump_json(
+        {"_generated": generated, "config": config, "apps": apps, "categories": group_apps_by_category(apps)},
+        pretty=pretty
+    )
+
+
+def build_apps_json(apps_json_path: str, config: Dict[str, Any], apps: List[Dict[str, Any]], pretty: bool = False) -> bytes:
+    """
+    Serialize the apps.json document, keeping the previous timestamp if nothing changed.
+    
+    The document (and the pages it is inlined into) only gets a new _generated
+    timestamp when the config or app list actually changed, so regenerating
+    from unchanged inputs produces byte-identical outputs that are not rewritten.
+    
+    Args:
+        apps_json_path: Path of the existing apps.json, if any
+        config: Page configuration from get_config_from_env_and_labels()
+        apps: App list from build_app_list()
+        pretty: Indent the output for human readers (default: compact)
         
-        # Extract HostRegexp() patterns
-        elif "HostRegexp(" in part:
-            start = part.find("HostRegexp(") + 11
-            end = part.find(")", start)
-            if end > start:
-                host = part[start:end].strip("`").strip("'").strip('"')
-                # For regexp, take as-is but may need cleanup
-                host = host.replace("{", "").replace("}", "").split(",")[0].strip()
-                urls.append(f"{protocol}://{host}")
+    Returns:
+        UTF-8 encoded JSON
+    """
+    try:
+        with open(apps_json_path, 'rb') as f:
+            existing = f.read()
+        previous = load_json(existing).get("_generated")
+    except Exception:
+        # Missing or unreadable file; there is no timestamp to keep
+        previous = None
     
-    return urls
+    if isinstance(previous, str):
+        apps_json = dump_apps_json(previous, config, apps, pretty=pretty)
+        if apps_json == existing:
+            return apps_json
+    
+    return dump_apps_json(time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), config, apps, pretty=pretty)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_overrides(override_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse an overrides file; cached per (path, mtime, size) so unchanged files are parsed once."""
+    with open(override_file, 'rb') as f:
+        return load_json(f.read())
 
 
 def load_overrides(override_file: Optional[str] = None) -> Dict[str, Any]:
     """
     Load app overrides from JSON file.
     
+    The parsed overrides are cached until the file's mtime or size changes, so
+    repeated generations in --watch mode only cost a stat(). The returned
+    dictionary is shared and must not be modified.
+    
     Args:
         override_file: Path to override JSON file
         
     Returns:
         Dictionary of overrides
     """
-    if not override_file or not os.path.exists(override_file):
+    if not override_file:
         return {}
     
     try:
-        with open(override_file, 'r') as f:
-            return json.load(f)
+        st = os.stat(override_file)
+        return _read_overrides(override_file, st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        return {}
     except Exception as e:
         print(f"Warning: Could not load overrides from {override_file}: {e}", file=sys.stderr)
         return {}
 
 
+@functools.lru_cache(maxsize=1024)
+def _title(name: str) -> str:
+    """Default display name for a service or app key (e.g. "my-app" -> "My App")."""
+    return name.replace("-", " ").title()
+
+
 def build_app_list(
     service_urls: Dict[str, List[str]],
     service_metadata: Dict[str, Dict[str, Any]],
@@ -419,8 +866,18 @@ def build_app_list(
     apps = []
     
     # Process services from Docker that have traefik-home.* labels
-    # Only include services that have metadata (meaning they have traefik-home labels)
-    for service_name, urls in service_urls.items():
+    # IMPORTANT: Only services with metadata (meaning they have traefik-home labels)
+    # are included, so walk the metadata rather than every service/router URL key.
+    # Services discovered from Traefik API without traefik-home labels never appear here.
+    for service_name, metadata in service_metadata.items():
+        if not metadata:
+            continue
+        
+        urls = service_urls.get(service_name)
+        if urls is None:
+            # No router for this container
+            continue
+        
         # Skip router keys (these are just for external app matching)
         if service_name.endswith("@docker") or service_name.endswith("@file"):
             continue
@@ -430,17 +887,10 @@ def build_app_list(
         if service_name in external_apps:
             continue
         
-        # IMPORTANT: Only include services that have traefik-home metadata
-        # Services discovered from Traefik API without traefik-home labels are skipped
-        metadata = service_metadata.get(service_name, {})
-        if not metadata:
-            # No traefik-home labels on this container, skip it
-            continue
-        
-        override = overrides.get(service_name, {})
+        override = overrides.get(service_name) or _EMPTY
         
         # Check if app should be hidden (from Docker label or override)
-        if metadata.get("hide", False) or override.get("Hide", False):
+        if metadata.get("hide") or override.get("Hide"):
             continue
         
         # Check if enabled (default to True for Docker services)
@@ -448,15 +898,16 @@ def build_app_list(
             continue
         
         # Determine category based on admin flag
-        is_admin = metadata.get("is_admin", False)
-        default_category = "Admin" if is_admin else "Apps"
+        default_category = "Admin" if metadata.get("is_admin") else "Apps"
         
         # Get icon from Docker label first, then override
-        icon = metadata.get("icon", "") or override.get("Icon", "")
+        icon = metadata.get("icon") or override.get("Icon", "")
         
-        # Get alias from Docker label first, then override
-        alias = metadata.get("alias", "")
-        display_name = override.get("Name", alias if alias else service_name.replace("-", " ").title())
+        # Get name from override first, then Docker alias label
+        if "Name" in override:
+            display_name = override["Name"]
+        else:
+            display_name = metadata.get("alias") or _title(service_name)
         
         app = {
             "name": display_name,
@@ -468,6 +919,9 @@ def build_app_list(
         }
         apps.append(app)
     
+    # Service keys to match external apps against, collected once for all apps
+    service_items = [(svc_key, url_list) for svc_key, url_list in service_urls.items() if svc_key]
+    
     # Process external apps from traefik-home.app.<name> labels
     for app_name, app_config in external_apps.items():
         # Skip if not enabled
@@ -478,25 +932,17 @@ def build_app_list(
         urls = set()
         
         # Try to find matching Traefik router(s) using multiple patterns
-        for svc_key, url_list in service_urls.items():
-            if not svc_key:
-                continue
-            # Flexible matching: exact match, containment in either direction, or hyphenated variants
-            if (app_name == svc_key or 
-                app_name in svc_key or 
-                svc_key in app_name or 
-                svc_key.startswith(app_name + "-") or 
-                app_name.startswith(svc_key + "-")):
+        for svc_key, url_list in service_items:
+            # Flexible matching: containment in either direction, which also covers
+            # exact matches and hyphenated variants ("app-web" / "app" in "app-web")
+            if app_name in svc_key or svc_key in app_name:
                 urls.update(url_list)
                 print(f"Info: External app '{app_name}' matched Traefik service '{svc_key}'")
         
-        # Convert to sorted list
-        urls = sorted(list(urls))
-        
-        # Add any manually specified URLs from .url labels (these are additive)
-        if "urls" in app_config:
-            urls.extend(app_config["urls"])
-            urls = sorted(list(set(urls)))  # Remove duplicates and sort
+        # Add any manually specified URLs from .url labels (these are additive),
+        # then sort the de-duplicated union once
+        urls.update(app_config.get("urls", ()))
+        urls = sorted(urls)
         
         # Skip if no URLs found anywhere
         if not urls:
@@ -508,7 +954,7 @@ def build_app_list(
         default_category = "Admin" if is_admin else "Apps"
         
         app = {
-            "name": app_config.get("alias", app_name.replace("-", " ").title()),
+            "name": app_config["alias"] if "alias" in app_config else _title(app_name),
             "urls": urls,
             "icon": app_config.get("icon", ""),
             "description": app_config.get("description", ""),
@@ -539,7 +985,7 @@ def build_app_list(
                 continue
             
             app = {
-                "name": override.get("Name", service_name.replace("-", " ").title()),
+                "name": override["Name"] if "Name" in override else _title(service_name),
                 "urls": urls,
                 "icon": override.get("Icon", ""),
                 "description": override.get("Description", ""),
@@ -549,74 +995,78 @@ def build_app_list(
             apps.append(app)
     
     # Sort by name
-    apps.sort(key=lambda x: x["name"])
+    apps.sort(key=itemgetter("name"))
     
     return apps
 
 
-def get_external_apps_from_labels(docker_client: docker.DockerClient) -> Dict[str, Dict[str, Any]]:
+def group_apps_by_category(apps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Group apps by category for the client, so it does not have to.
+    
+    Args:
+        apps: App list from build_app_list()
+        
+    Returns:
+        Categories sorted by name, each with the indices of its apps in the
+        (already name-sorted) app list
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, app in enumerate(apps):
+        groups.setdefault(str(app.get("category") or "Apps"), []).append(index)
+    return [{"name": name, "apps": groups[name]} for name in sorted(groups)]
+
+
+def get_external_apps_from_labels(container: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """
     Get external apps defined via traefik-home.app.<name> labels on the traefik-home container.
     
     Args:
-        docker_client: Docker client instance
+        container: The traefik-home container from find_self_container(), if found
         
     Returns:
         Dictionary mapping app names to their configuration
     """
     external_apps = {}
     
+    if container is None:
+        return external_apps
+    
     try:
-        current_container_id = os.getenv("HOSTNAME")
-        if current_container_id:
-            try:
-                container = docker_client.containers.get(current_container_id)
-                labels = container.labels
-                
-                # Parse traefik-home.app.<name>.<attribute> labels
-                for key, value in labels.items():
-                    if key.startswith("traefik-home.app."):
-                        parts = key.split(".")
-                        if len(parts) >= 4:
-                            app_name = parts[2]
-                            attribute = parts[3]
-                            
-                            if app_name not in external_apps:
-                                external_apps[app_name] = {}
-                            
-                            # Map attribute names
-                            if attribute == "enable":
-                                external_apps[app_name]["enabled"] = value.lower() == "true"
-                            elif attribute == "alias":
-                                external_apps[app_name]["alias"] = value
-                            elif attribute == "icon":
-                                external_apps[app_name]["icon"] = value
-                            elif attribute == "url":
-                                # Support multiple .url labels - store as list
-                                if "urls" not in external_apps[app_name]:
-                                    external_apps[app_name]["urls"] = []
-                                external_apps[app_name]["urls"].append(value)
-                            elif attribute == "admin":
-                                external_apps[app_name]["is_admin"] = value.lower() == "true"
-                            elif attribute == "category":
-                                external_apps[app_name]["category"] = value
-                            elif attribute == "description":
-                                external_apps[app_name]["description"] = value
-                                
-            except docker.errors.NotFound:
-                pass
+        labels = container.get("Labels") or {}
+        
+        # Parse traefik-home.app.<name>.<attribute> labels
+        for key, value in labels.items():
+            if not key.startswith("traefik-home.app."):
+                continue
+            match = APP_LABEL_RE.match(key)
+            if not match:
+                continue
+            app_name, attribute = match.groups()
+            app_config = external_apps.setdefault(app_name, {})
+            
+            if attribute == "url":
+                # Support multiple .url labels - store as list
+                app_config.setdefault("urls", []).append(value)
+                continue
+            
+            # Map attribute names
+            handler = EXTERNAL_APP_ATTRIBUTES.get(attribute)
+            if handler:
+                config_key, parse_value = handler
+                app_config[config_key] = parse_value(value)
     except Exception as e:
         print(f"Warning: Could not read traefik-home container labels: {e}", file=sys.stderr)
     
     return external_apps
 
 
-def get_config_from_env_and_labels(docker_client: docker.DockerClient) -> Dict[str, Any]:
+def get_config_from_env_and_labels(container: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Get configuration from environment variables and traefik-home container labels.
     
     Args:
-        docker_client: Docker client instance
+        container: The traefik-home container from find_self_container(), if found
         
     Returns:
         Dictionary with configuration values
@@ -626,349 +1076,318 @@ def get_config_from_env_and_labels(docker_client: docker.DockerClient) -> Dict[s
         "custom_css_url": os.getenv("CUSTOM_CSS_URL", "/custom.css"),
         "custom_background_url": os.getenv("CUSTOM_BACKGROUND_URL", ""),
         "authentik_logout_url": os.getenv("AUTHENTIK_LOGOUT_URL", ""),
-        "show_footer": os.getenv("SHOW_FOOTER", "true").lower() == "true",
-        "show_status_dot": os.getenv("SHOW_STATUS_DOT", "true").lower() == "true",
-        "open_in_new_tab": os.getenv("OPEN_IN_NEW_TAB", "false").lower() == "true",
+        "show_footer": _bool(os.getenv("SHOW_FOOTER", "true")),
+        "show_status_dot": _bool(os.getenv("SHOW_STATUS_DOT", "true")),
+        "open_in_new_tab": _bool(os.getenv("OPEN_IN_NEW_TAB", "false")),
         "sort_by": "default"
     }
     
-    # Try to get traefik-home container labels
+    # Override with traefik-home container labels if present
+    if container is None:
+        return config
+    
     try:
-        current_container_id = os.getenv("HOSTNAME")
-        if current_container_id:
-            try:
-                container = docker_client.containers.get(current_container_id)
-                labels = container.labels
-                
-                # Override with container labels if present
-                if "traefik-home.show-footer" in labels:
-                    config["show_footer"] = labels["traefik-home.show-footer"].lower() == "true"
-                if "traefik-home.show-status-dot" in labels:
-                    config["show_status_dot"] = labels["traefik-home.show-status-dot"].lower() == "true"
-                if "traefik-home.sort-by" in labels:
-                    config["sort_by"] = labels["traefik-home.sort-by"]
-                if "traefik-home.open-link-in-new-tab" in labels:
-                    config["open_in_new_tab"] = labels["traefik-home.open-link-in-new-tab"].lower() == "true"
-            except docker.errors.NotFound:
-                pass
+        labels = container.get("Labels") or {}
+        
+        if "traefik-home.show-footer" in labels:
+            config["show_footer"] = _bool(labels["traefik-home.show-footer"])
+        if "traefik-home.show-status-dot" in labels:
+            config["show_status_dot"] = _bool(labels["traefik-home.show-status-dot"])
+        if "traefik-home.sort-by" in labels:
+            config["sort_by"] = labels["traefik-home.sort-by"]
+        if "traefik-home.open-link-in-new-tab" in labels:
+            config["open_in_new_tab"] = _bool(labels["traefik-home.open-link-in-new-tab"])
     except Exception as e:
         print(f"Warning: Could not read container labels: {e}", file=sys.stderr)
     
     return config
 
 
-def load_template(template_path: str) -> Optional[str]:
+@functools.lru_cache(maxsize=8)
+def _read_template(template_path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a template file; cached per (path, mtime, size) so unchanged files are read once."""
+    with open(template_path, 'rb') as f:
+        return f.read()
+
+
+def load_template_bytes(template_path: str) -> Optional[bytes]:
     """
-    Load template from file if it exists.
+    Load raw template bytes from file if it exists.
+    
+    The content is cached until the file's mtime or size changes, so repeated
+    generations in --watch mode only cost a stat().
     
     Args:
         template_path: Path to template file
         
     Returns:
-        Template content or None if not found
+        UTF-8 template content or None if not found
     """
-    if os.path.exists(template_path):
-        try:
-            with open(template_path, 'r') as f:
-                return f.read()
-        except Exception as e:
-            print(f"Warning: Could not load template from {template_path}: {e}", file=sys.stderr)
+    try:
+        st = os.stat(template_path)
+        return _read_template(template_path, st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Could not load template from {template_path}: {e}", file=sys.stderr)
     return None
 
 
-def get_default_client_html() -> str:
+# Fallback page used when no template file is found; shipped next to this
+# script so it is only read (once) when actually needed
+DEFAULT_CLIENT_HTML_PATH = Path(__file__).resolve().parent / "templates" / "default.html"
+
+
+@functools.cache
+def _default_client_html_bytes() -> bytes:
+    """Default template bytes; only read when no template file exists, then reused."""
+    return DEFAULT_CLIENT_HTML_PATH.read_bytes()
+
+
+def generate(args: argparse.Namespace, containers: List[Dict[str, Any]], traefik_api: Optional[str]) -> None:
     """
-    Get default client-side HTML template.
+    Build the app list from the given containers and write the output files.
+    
+    Args:
+        args: Parsed command line arguments
+        containers: Raw container dictionaries from list_containers()
+        traefik_api: Optional Traefik API base URL
+    """
+    # Build service URL map (from Docker labels AND Traefik API)
+    print("Building service URL map from Docker and Traefik API...")
+    service_urls, service_metadata = build_service_url_map(containers, traefik_api)
+    print(f"Found {len(service_urls)} services")
+    
+    # Locate the traefik-home container once; both readers below only need it
+    self_container = find_self_container(containers)
+    
+    # Get external apps from traefik-home container labels
+    print("Reading external apps from traefik-home container labels...")
+    external_apps = get_external_apps_from_labels(self_container)
+    print(f"Found {len(external_apps)} external apps")
+    
+    # Get configuration from environment and labels
+    print("Reading configuration from environment and labels...")
+    config = get_config_from_env_and_labels(self_container)
+    
+    # Load overrides
+    print(f"Loading overrides from {args.overrides}...")
+    overrides = load_overrides(args.overrides)
+    print(f"Loaded {len(overrides)} overrides")
+    
+    # Build app list
+    print("Building app list...")
+    apps = build_app_list(service_urls, service_metadata, overrides, external_apps)
+    print(f"Generated {len(apps)} apps")
+    
+    # Debug output: print all apps found in a single write
+    if args.verbose:
+        lines = ["", "=== Apps List ==="]
+        lines.extend(
+            f"  - {app['name']}: {app['urls'][0] if app['urls'] else 'no URL'} "
+            f"(icon: {'yes' if app['icon'] else 'no'}, category: {app['category']})"
+            for app in apps
+        )
+        lines.extend(["=================", "", ""])
+        sys.stdout.write("\n".join(lines))
+    
+    out = os.path.join(args.output_dir, "")  # ensures a single trailing separator
+    apps_json_path = f"{out}apps.json"
+    html_path = f"{out}home.html"
+    index_path = f"{out}index.html"
+    
+    # Create apps.json with generation timestamp and config
+    apps_json = build_apps_json(apps_json_path, config, apps, pretty=args.pretty)
+    
+    # Load or use default client HTML template
+    html_content = load_template_bytes(args.template)
+    if html_content is None:
+        print(f"Template not found at {args.template}, using default template {DEFAULT_CLIENT_HTML_PATH}")
+        try:
+            html_content = _default_client_html_bytes()
+        except OSError as e:
+            print(f"Error: Could not read default template {DEFAULT_CLIENT_HTML_PATH}: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        print(f"Loaded template from {args.template}")
+    
+    if APPS_JSON_PLACEHOLDER in html_content:
+        # Reuse the apps.json bytes. "<", ">" and "&" can only occur inside JSON
+        # strings, where their \u escapes are equivalent; escaping them keeps
+        # values like "</script>" or "<!--" from changing how the <script> parses
+        inline_json = apps_json.replace(b"&", b"\\u0026").replace(b"<", b"\\u003c").replace(b">", b"\\u003e")
+        html_content = html_content.replace(APPS_JSON_PLACEHOLDER, inline_json)
+    
+    # Write apps.json and client HTML atomically, sharing the fsync barriers.
+    # Files are only rewritten when their bytes differ, so unchanged outputs
+    # keep their mtime (and HTTP cache validators).
+    # Each file also gets a precompressed .gz sibling for nginx's gzip_static
+    html_gz = gzip_static(html_content)
+    outputs = {
+        apps_json_path: apps_json,
+        f"{apps_json_path}.gz": gzip_static(apps_json),
+        html_path: html_content,
+        f"{html_path}.gz": html_gz,
+    }
+    files = {path: content for path, content in outputs.items() if not file_has_content(path, content)}
+    if files:
+        print(f"Writing {', '.join(files)}...")
+        atomic_write_batch(files)
+    else:
+        print("Output files are unchanged, nothing to write")
+    
+    # Also write to index.html (and index.html.gz) for default serving
+    for src_path, path, content in (
+        (html_path, index_path, html_content),
+        (f"{html_path}.gz", f"{index_path}.gz", html_gz),
+    ):
+        if src_path in files or not file_has_content(path, content):
+            print(f"Linking {path}...")
+            atomic_link(src_path, path)
+    
+    print("Generation complete!")
+
+
+def _page_inputs(container: Dict[str, Any]) -> Tuple[Any, Any]:
+    """The parts of a raw container dictionary that affect the generated page."""
+    return container.get("Names"), container.get("Labels")
+
+
+def apply_container_event(docker_client: docker.DockerClient, containers_by_id: Dict[str, Dict[str, Any]], event: Dict[str, Any]) -> bool:
+    """
+    Update the container map for a single Docker container event.
+    
+    On start/update only the affected container is re-fetched; on die/destroy
+    it is dropped along with its cached label parse.
     
+    Args:
+        docker_client: Docker client instance
+        containers_by_id: Raw container dictionaries keyed by container ID (updated in place)
+        event: Decoded Docker event
+        
     Returns:
-        HTML template string
+        True if the container map changed and the page should be regenerated
     """
-    return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Traefik Home</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 2rem;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        h1 {
-            color: white;
-            text-align: center;
-            margin-bottom: 2rem;
-            font-size: 2.5rem;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
-        }
-        .apps-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 1.5rem;
-            margin-top: 2rem;
-        }
-        .app-card {
-            background: white;
-            border-radius: 12px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            transition: transform 0.2s, box-shadow 0.2s;
-            cursor: pointer;
-        }
-        .app-card:hover {
-            transform: translateY(-4px);
-            box-shadow: 0 8px 12px rgba(0,0,0,0.15);
-        }
-        .app-header {
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-            margin-bottom: 1rem;
-        }
-        .app-icon {
-            font-size: 2rem;
-        }
-        .app-name {
-            font-size: 1.25rem;
-            font-weight: 600;
-            color: #333;
-            flex: 1;
-        }
-        .app-badge {
-            background: #667eea;
-            color: white;
-            padding: 0.25rem 0.75rem;
-            border-radius: 12px;
-            font-size: 0.75rem;
-            font-weight: 600;
-        }
-        .app-description {
-            color: #666;
-            font-size: 0.9rem;
-            margin-bottom: 1rem;
-        }
-        .app-urls {
-            margin-top: 1rem;
-            padding-top: 1rem;
-            border-top: 1px solid #eee;
-        }
-        .app-url {
-            display: block;
-            color: #667eea;
-            text-decoration: none;
-            font-size: 0.85rem;
-            padding: 0.25rem 0;
-            word-break: break-all;
-        }
-        .app-url:hover {
-            text-decoration: underline;
-        }
-        .app-url.primary {
-            font-weight: 600;
-            font-size: 0.95rem;
-        }
-        .category-section {
-            margin-bottom: 3rem;
-        }
-        .category-title {
-            color: white;
-            font-size: 1.5rem;
-            margin-bottom: 1rem;
-            padding-bottom: 0.5rem;
-            border-bottom: 2px solid rgba(255,255,255,0.3);
-        }
-        .error-message {
-            background: #fee;
-            color: #c33;
-            padding: 1rem;
-            border-radius: 8px;
-            margin: 2rem 0;
-            text-align: center;
-        }
-        .loading {
-            color: white;
-            text-align: center;
-            font-size: 1.2rem;
-            margin-top: 3rem;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🏠 Traefik Home</h1>
-        <div id="loading" class="loading">Loading apps...</div>
-        <div id="error" class="error-message" style="display: none;"></div>
-        <div id="apps-container"></div>
-    </div>
-
-    <script>
-        // Escape HTML to prevent XSS
-        function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }
+    action = event.get("Action") or event.get("status") or ""
+    container_id = event.get("id") or (event.get("Actor") or {}).get("ID")
+    if not container_id or action not in WATCH_EVENTS:
+        return False
+    
+    if action in ("die", "destroy"):
+        _container_cache.pop(container_id, None)
+        return containers_by_id.pop(container_id, None) is not None
+    
+    try:
+        fetched = docker_client.api.containers(filters={"id": container_id})
+    except Exception as e:
+        print(f"Warning: Could not fetch container {container_id[:12]}: {e}", file=sys.stderr)
+        return False
+    
+    if not fetched:
+        # Container is no longer running
+        _container_cache.pop(container_id, None)
+        return containers_by_id.pop(container_id, None) is not None
+    
+    previous = containers_by_id.get(container_id)
+    containers_by_id[container_id] = fetched[0]
+    # Only names and labels feed the page; an update or re-fetch that leaves
+    # them unchanged does not need a regeneration
+    return previous is None or _page_inputs(previous) != _page_inputs(fetched[0])
 
-        // Select preferred URL based on current hostname
-        function selectPreferredUrl(urls) {
-            if (!urls || urls.length === 0) return null;
-            if (urls.length === 1) return urls[0];
 
-            const currentHost = window.location.hostname;
-            
-            // Try to find URL with matching hostname
-            for (const url of urls) {
-                try {
-                    const urlObj = new URL(url);
-                    if (urlObj.hostname === currentHost || 
-                        urlObj.hostname.endsWith('.' + currentHost) ||
-                        currentHost.endsWith('.' + urlObj.hostname)) {
-                        return url;
-                    }
-                } catch (e) {
-                    console.warn('Invalid URL:', url, e);
-                }
-            }
-            
-            // Default to first URL
-            return urls[0];
-        }
+def ensure_traefik_api(traefik_api: Optional[str]) -> Optional[str]:
+    """
+    Return the known Traefik API URL, or retry discovery if there is none yet.
+    
+    Traefik is not started alongside traefik-home, so it may come up (or become
+    reachable) long after the first generation in --watch mode.
+    
+    Args:
+        traefik_api: Traefik API base URL found so far, if any
+        
+    Returns:
+        Traefik API base URL or None if it is still not reachable
+    """
+    if traefik_api:
+        return traefik_api
+    traefik_api = discover_traefik_api()
+    if traefik_api:
+        print(f"Using Traefik API: {traefik_api}")
+    return traefik_api
 
-        // Render apps
-        function renderApps(apps) {
-            const container = document.getElementById('apps-container');
-            container.innerHTML = '';
-
-            // Group by category
-            const categories = {};
-            apps.forEach(app => {
-                const category = app.category || 'Apps';
-                if (!categories[category]) {
-                    categories[category] = [];
-                }
-                categories[category].push(app);
-            });
-
-            // Render each category
-            Object.keys(categories).sort().forEach(category => {
-                const section = document.createElement('div');
-                section.className = 'category-section';
-
-                const title = document.createElement('h2');
-                title.className = 'category-title';
-                title.textContent = category;
-                section.appendChild(title);
-
-                const grid = document.createElement('div');
-                grid.className = 'apps-grid';
-
-                categories[category].forEach(app => {
-                    const card = document.createElement('div');
-                    card.className = 'app-card';
-
-                    // Select preferred URL
-                    const preferredUrl = selectPreferredUrl(app.urls);
-                    
-                    if (preferredUrl) {
-                        card.onclick = () => window.location.href = preferredUrl;
-                    }
-
-                    const header = document.createElement('div');
-                    header.className = 'app-header';
-
-                    if (app.icon) {
-                        const icon = document.createElement('span');
-                        icon.className = 'app-icon';
-                        icon.textContent = app.icon;
-                        header.appendChild(icon);
-                    }
-
-                    const name = document.createElement('div');
-                    name.className = 'app-name';
-                    name.textContent = app.name;
-                    header.appendChild(name);
-
-                    if (app.badge) {
-                        const badge = document.createElement('span');
-                        badge.className = 'app-badge';
-                        badge.textContent = app.badge;
-                        header.appendChild(badge);
-                    }
-
-                    card.appendChild(header);
-
-                    if (app.description) {
-                        const desc = document.createElement('div');
-                        desc.className = 'app-description';
-                        desc.textContent = app.description;
-                        card.appendChild(desc);
-                    }
-
-                    // Show all URLs
-                    if (app.urls && app.urls.length > 0) {
-                        const urlsDiv = document.createElement('div');
-                        urlsDiv.className = 'app-urls';
-
-                        app.urls.forEach((url, idx) => {
-                            const urlLink = document.createElement('a');
-                            urlLink.className = 'app-url';
-                            if (url === preferredUrl) {
-                                urlLink.className += ' primary';
-                            }
-                            urlLink.href = url;
-                            urlLink.textContent = url;
-                            urlLink.onclick = (e) => e.stopPropagation();
-                            urlsDiv.appendChild(urlLink);
-                        });
-
-                        card.appendChild(urlsDiv);
-                    }
-
-                    grid.appendChild(card);
-                });
-
-                section.appendChild(grid);
-                container.appendChild(section);
-            });
-        }
 
-        // Load apps
-        fetch('/apps.json')
-            .then(response => {
-                if (!response.ok) {
-                    throw new Error('Failed to load apps.json');
-                }
-                return response.json();
-            })
-            .then(data => {
-                document.getElementById('loading').style.display = 'none';
-                if (data.apps && data.apps.length > 0) {
-                    renderApps(data.apps);
-                } else {
-                    document.getElementById('error').textContent = 'No apps found';
-                    document.getElementById('error').style.display = 'block';
-                }
-            })
-            .catch(error => {
-                console.error('Error loading apps:', error);
-                document.getElementById('loading').style.display = 'none';
-                document.getElementById('error').textContent = 'Error loading apps: ' + error.message;
-                document.getElementById('error').style.display = 'block';
-            });
-    </script>
-</body>
-</html>"""
+def watch_docker_events(docker_client: docker.DockerClient, args: argparse.Namespace, containers: List[Dict[str, Any]], traefik_api: Optional[str], since: Optional[int] = None) -> None:
+    """
+    Regenerate the page whenever a container starts, stops or changes.
+    
+    Streams Docker events instead of polling, so dockerd is only queried for
+    the containers that actually changed. If the event stream breaks, the full
+    container list is re-read before resuming.
+    
+    Each subscription replays events from just before the matching container
+    listing, so changes made while listing or generating are not missed.
+    A failed generation is retried after the next resynchronisation, even if
+    the containers did not change in the meantime.
+    
+    Args:
+        docker_client: Docker client instance
+        args: Parsed command line arguments
+        containers: Initial raw container dictionaries from list_containers()
+        traefik_api: Optional Traefik API base URL (discovery is retried while unset)
+        since: Unix time taken before `containers` was listed (default: now)
+    """
+    containers_by_id = {c["Id"]: c for c in containers if c.get("Id")}
+    # Set while the page is behind containers_by_id, i.e. after a failed generation
+    needs_regeneration = False
+    
+    while True:
+        try:
+            print("Watching Docker events...")
+            events = docker_client.events(
+                decode=True,
+                since=since,
+                filters={"type": "container", "event": WATCH_EVENTS}
+            )
+            for event in events:
+                if apply_container_event(docker_client, containers_by_id, event):
+                    needs_regeneration = True
+                if not needs_regeneration:
+                    continue
+                print(f"Container {event.get('Action', '')} event, regenerating...")
+                try:
+                    traefik_api = ensure_traefik_api(traefik_api)
+                    generate(args, list(containers_by_id.values()), traefik_api)
+                    needs_regeneration = False
+                except Exception as e:
+                    print(f"Warning: Generation failed: {e}", file=sys.stderr)
+                    # Retry after the resync below rather than waiting for another event
+                    break
+        except Exception as e:
+            print(f"Warning: Docker event stream failed: {e}", file=sys.stderr)
+        
+        # Resynchronise after the stream ends or fails
+        time.sleep(5)
+        _container_cache.clear()
+        since = int(time.time())
+        previous_inputs = {cid: _page_inputs(c) for cid, c in containers_by_id.items()}
+        containers_by_id = {c["Id"]: c for c in list_containers(docker_client) if c.get("Id")}
+        if (not needs_regeneration and
+                {cid: _page_inputs(c) for cid, c in containers_by_id.items()} == previous_inputs):
+            print("No container changes while reconnecting, skipping regeneration")
+            continue
+        try:
+            traefik_api = ensure_traefik_api(traefik_api)
+            generate(args, list(containers_by_id.values()), traefik_api)
+            needs_regeneration = False
+        except Exception as e:
+            print(f"Warning: Generation failed: {e}", file=sys.stderr)
+            needs_regeneration = True
+
+
+def _exit_on_sigterm(signum: int, frame: Any) -> None:
+    """Exit cleanly on SIGTERM (e.g. `docker stop`), which Python ignores as PID 1."""
+    print("Received SIGTERM, exiting")
+    sys.exit(0)
 
 
 def main():
@@ -994,8 +1413,26 @@ def main():
         default=None,
         help="Traefik API URL (default: auto-discover or TRAEFIK_API_URL env)"
     )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print the generated app list"
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent apps.json for debugging (default: compact)"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate on Docker container events"
+    )
     args = parser.parse_args()
     
+    # The entrypoint execs this script in --watch mode, so it runs as PID 1
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    
     # Ensure output directory exists
     os.makedirs(args.output_dir, exist_ok=True)
     
@@ -1007,74 +1444,22 @@ def main():
         sys.exit(1)
     
     # Discover Traefik API endpoint
-    traefik_api = args.traefik_api or discover_traefik_api()
+    # Normalize once so every API path below is joined onto a slash-free base
+    traefik_api = (args.traefik_api or "").rstrip("/") or discover_traefik_api()
     if traefik_api:
         print(f"Using Traefik API: {traefik_api}")
     else:
         print("Warning: Could not discover Traefik API - external apps from file provider may not be found")
     
-    # Build service URL map (from Docker labels AND Traefik API)
-    print("Building service URL map from Docker and Traefik API...")
-    service_urls, service_metadata = build_service_url_map(docker_client, traefik_api)
-    print(f"Found {len(service_urls)} services")
-    
-    # Get external apps from traefik-home container labels
-    print("Reading external apps from traefik-home container labels...")
-    external_apps = get_external_apps_from_labels(docker_client)
-    print(f"Found {len(external_apps)} external apps")
-    
-    # Get configuration from environment and labels
-    print("Reading configuration from environment and labels...")
-    config = get_config_from_env_and_labels(docker_client)
+    # List running containers once and reuse the result everywhere; the time
+    # is taken first so --watch can replay events that race with the listing
+    listed_at = int(time.time())
+    containers = list_containers(docker_client)
     
-    # Load overrides
-    print(f"Loading overrides from {args.overrides}...")
-    overrides = load_overrides(args.overrides)
-    print(f"Loaded {len(overrides)} overrides")
-    
-    # Build app list
-    print("Building app list...")
-    apps = build_app_list(service_urls, service_metadata, overrides, external_apps)
-    print(f"Generated {len(apps)} apps")
+    generate(args, containers, traefik_api)
     
-    # Debug output: print all apps found
-    print("\n=== Apps List ===")
-    for app in apps:
-        first_url = app['urls'][0] if app['urls'] else 'no URL'
-        print(f"  - {app['name']}: {first_url} (icon: {'yes' if app['icon'] else 'no'}, category: {app['category']})")
-    print("=================\n")
-    
-    # Create apps.json with generation timestamp and config
-    apps_data = {
-        "_generated": datetime.now(timezone.utc).isoformat(),
-        "config": config,
-        "apps": apps
-    }
-    
-    # Write apps.json atomically
-    apps_json_path = os.path.join(args.output_dir, "apps.json")
-    print(f"Writing {apps_json_path}...")
-    atomic_write(apps_json_path, json.dumps(apps_data, indent=2))
-    
-    # Load or use default client HTML template
-    template_content = load_template(args.template)
-    if template_content is None:
-        print(f"Template not found at {args.template}, using default embedded template")
-        template_content = get_default_client_html()
-    else:
-        print(f"Loaded template from {args.template}")
-    
-    # Write client HTML atomically
-    html_path = os.path.join(args.output_dir, "home.html")
-    print(f"Writing {html_path}...")
-    atomic_write(html_path, template_content)
-    
-    # Also write to index.html for default serving
-    index_path = os.path.join(args.output_dir, "index.html")
-    print(f"Writing {index_path}...")
-    atomic_write(index_path, template_content)
-    
-    print("Generation complete!")
+    if args.watch:
+        watch_docker_events(docker_client, args, containers, traefik_api, since=listed_at)
 
 
 if __name__ == "__main__":
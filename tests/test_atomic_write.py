@@ -106,6 +106,15 @@ class TestAtomicWrite:
         assert filepath.exists()
         assert filepath.read_text() == content
     
+    def test_atomic_write_bytes_content(self, tmp_path):
+        """Test atomic_write with already-encoded bytes"""
+        filepath = tmp_path / "bytes.json"
+        content = '{"name": "Émoji 🌍"}'.encode("utf-8")
+        
+        generate_page.atomic_write(str(filepath), content)
+        
+        assert filepath.read_bytes() == content
+    
     def test_atomic_write_sets_permissions(self, tmp_path):
         """Test that atomic_write sets correct file permissions"""
         filepath = tmp_path / "test.txt"
@@ -147,5 +156,84 @@ class TestAtomicWrite:
         assert len(tmp_files) == 0
 
 
+class TestAtomicWriteBatch:
+    """Tests for atomic_write_batch functionality"""
+    
+    def test_atomic_write_batch_writes_all_files(self, tmp_path):
+        """Test that every file in the batch is written"""
+        files = {
+            str(tmp_path / "apps.json"): b'{"apps":[]}',
+            str(tmp_path / "home.html"): "<html></html>",
+        }
+        
+        generate_page.atomic_write_batch(files)
+        
+        assert (tmp_path / "apps.json").read_bytes() == b'{"apps":[]}'
+        assert (tmp_path / "home.html").read_text() == "<html></html>"
+        assert list(tmp_path.glob(".*")) == []
+    
+    def test_atomic_write_batch_cleans_up_on_error(self, tmp_path):
+        """Test that no target is replaced and no temp file remains if one write fails"""
+        target = tmp_path / "apps.json"
+        target.write_text("original")
+        files = {
+            str(target): "new",
+            str(tmp_path / "missing-dir" / "home.html"): "<html></html>",
+        }
+        
+        with pytest.raises(OSError):
+            generate_page.atomic_write_batch(files)
+        
+        assert target.read_text() == "original"
+        assert [f.name for f in tmp_path.iterdir()] == ["apps.json"]
+
+
+class TestAtomicLink:
+    """Tests for atomic_link functionality"""
+    
+    def test_atomic_link_shares_inode(self, tmp_path):
+        """Test that the target becomes a hardlink of the source"""
+        src = tmp_path / "home.html"
+        dst = tmp_path / "index.html"
+        dst.write_text("old")
+        generate_page.atomic_write(str(src), "<html></html>")
+        
+        generate_page.atomic_link(str(src), str(dst))
+        
+        assert dst.read_text() == "<html></html>"
+        assert os.path.samefile(src, dst)
+        assert list(tmp_path.glob("*.tmp")) == []
+    
+    def test_atomic_link_falls_back_to_copy(self, tmp_path, monkeypatch):
+        """Test that the file is copied when hardlinks are unsupported"""
+        src = tmp_path / "home.html"
+        dst = tmp_path / "index.html"
+        src.write_text("<html></html>")
+        
+        def no_link(*args, **kwargs):
+            raise OSError("hardlinks not supported")
+        monkeypatch.setattr(os, "link", no_link)
+        
+        generate_page.atomic_link(str(src), str(dst))
+        
+        assert dst.read_text() == "<html></html>"
+        assert not os.path.samefile(src, dst)
+        assert list(tmp_path.glob(".*")) == []
+
+
+class TestFileHasContent:
+    """Tests for file_has_content functionality"""
+    
+    def test_file_has_content(self, tmp_path):
+        """Test matching, differing and missing files"""
+        filepath = tmp_path / "home.html"
+        filepath.write_bytes(b"<html></html>")
+        
+        assert generate_page.file_has_content(str(filepath), b"<html></html>")
+        assert not generate_page.file_has_content(str(filepath), b"<html>..</html>")
+        assert not generate_page.file_has_content(str(filepath), b"<html>")
+        assert not generate_page.file_has_content(str(tmp_path / "missing.html"), b"")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
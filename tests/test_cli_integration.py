@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Integration tests for generate_page CLI"""
 
+import gzip
 import json
 import os
 import sys
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -29,15 +31,17 @@ class TestCLIIntegration:
         
         # Mock Docker client with traefik-home labels
         mock_docker_client = Mock()
-        mock_container = Mock()
-        mock_container.name = "test-service"
-        mock_container.labels = {
-            "traefik.http.routers.test.rule": "Host(`test.example.com`)",
-            "com.docker.compose.service": "test-service",
-            "traefik-home.enable": "true",  # Must have traefik-home labels to be included
-            "traefik-home.alias": "Test Service"
+        mock_container = {
+            "Id": "abc123",
+            "Names": ["/test-service"],
+            "Labels": {
+                "traefik.http.routers.test.rule": "Host(`test.example.com`)",
+                "com.docker.compose.service": "test-service",
+                "traefik-home.enable": "true",  # Must have traefik-home labels to be included
+                "traefik-home.alias": "Test Service"
+            }
         }
-        mock_docker_client.containers.list.return_value = [mock_container]
+        mock_docker_client.api.containers.return_value = [mock_container]
         
         # Patch sys.argv and docker.from_env
         monkeypatch.setattr(sys, "argv", [
@@ -73,7 +77,7 @@ class TestCLIIntegration:
         
         # Mock Docker client
         mock_docker_client = Mock()
-        mock_docker_client.containers.list.return_value = []
+        mock_docker_client.api.containers.return_value = []
         
         # Patch sys.argv and docker.from_env
         monkeypatch.setattr(sys, "argv", [
@@ -92,11 +96,86 @@ class TestCLIIntegration:
         assert home_html.exists()
         assert index_html.exists()
         
+        # Precompressed copies for nginx gzip_static
+        assert gzip.decompress((output_dir / "index.html.gz").read_bytes()) == index_html.read_bytes()
+        assert gzip.decompress((output_dir / "apps.json.gz").read_bytes()) == (output_dir / "apps.json").read_bytes()
+        
         # Check that HTML contains expected content
         content = home_html.read_text()
         assert "<!DOCTYPE html>" in content
         assert "Traefik Home" in content
         assert "apps.json" in content
+        # The app data is inlined, so the page does not need to fetch it
+        assert "{{APPS_JSON}}" not in content
+        assert '"_generated"' in content
+    
+    @pytest.mark.parametrize("template", [
+        "/nonexistent/home.tmpl",  # falls back to the default page
+        str(Path(__file__).parent.parent / "app" / "templates" / "home-client.tmpl"),
+    ])
+    def test_main_skips_unchanged_html(self, tmp_path, monkeypatch, template):
+        """Test that a second run leaves identical HTML files untouched"""
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        
+        mock_docker_client = Mock()
+        mock_docker_client.api.containers.return_value = []
+        
+        monkeypatch.setattr(sys, "argv", [
+            "generate_page.py",
+            "--output-dir", str(output_dir),
+            "--template", template,
+            "--overrides", "/nonexistent/overrides.json"
+        ])
+        
+        # The second run happens a minute later; the inlined timestamp must not change
+        with patch("generate_page.docker.from_env", return_value=mock_docker_client), \
+                patch.object(generate_page.time, "gmtime", side_effect=[time.gmtime(0), time.gmtime(60)]):
+            generate_page.main()
+            home_inode = (output_dir / "home.html").stat().st_ino
+            index_inode = (output_dir / "index.html").stat().st_ino
+            home_gz_inode = (output_dir / "home.html.gz").stat().st_ino
+            generate_page.main()
+        
+        # Rewrites go through rename, so an unchanged inode means no rewrite
+        assert (output_dir / "home.html").stat().st_ino == home_inode
+        assert (output_dir / "index.html").stat().st_ino == index_inode
+        assert (output_dir / "home.html.gz").stat().st_ino == home_gz_inode
+        assert "1970-01-01T00:00:00Z" in (output_dir / "home.html").read_text()
+    
+    def test_main_rerun_writes_nothing(self, tmp_path, monkeypatch):
+        """Test that rerunning with identical inputs leaves every output untouched"""
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        
+        mock_docker_client = Mock()
+        mock_docker_client.api.containers.return_value = [{
+            "Id": "abc123",
+            "Names": ["/test-service"],
+            "Labels": {
+                "traefik.http.routers.test.rule": "Host(`test.example.com`)",
+                "com.docker.compose.service": "test-service",
+                "traefik-home.enable": "true"
+            }
+        }]
+        
+        monkeypatch.setattr(sys, "argv", [
+            "generate_page.py",
+            "--output-dir", str(output_dir),
+            "--template", str(Path(__file__).parent.parent / "app" / "templates" / "home-client.tmpl"),
+            "--overrides", "/nonexistent/overrides.json"
+        ])
+        names = ["apps.json", "apps.json.gz", "home.html", "home.html.gz", "index.html", "index.html.gz"]
+        
+        with patch("generate_page.docker.from_env", return_value=mock_docker_client), \
+                patch.object(generate_page.time, "gmtime", side_effect=[time.gmtime(0), time.gmtime(60)]):
+            generate_page.main()
+            before = {name: (output_dir / name).stat() for name in names}
+            generate_page.main()
+        
+        for name in names:
+            after = (output_dir / name).stat()
+            assert (after.st_ino, after.st_mtime_ns) == (before[name].st_ino, before[name].st_mtime_ns), name
     
     def test_main_with_multiple_urls_per_service(self, tmp_path, monkeypatch):
         """Test that main() includes all URLs for a service"""
@@ -105,17 +184,19 @@ class TestCLIIntegration:
         
         # Mock Docker client with service having multiple URLs and traefik-home labels
         mock_docker_client = Mock()
-        mock_container = Mock()
-        mock_container.name = "test-service"
-        mock_container.labels = {
-            "traefik.http.routers.test1.rule": "Host(`test1.example.com`)",
-            "traefik.http.routers.test2.rule": "Host(`test2.example.com`)",
-            "traefik.http.routers.test3.rule": "Host(`test3.example.com`)",
-            "com.docker.compose.service": "test-service",
-            "traefik-home.enable": "true",  # Must have traefik-home labels to be included
-            "traefik-home.alias": "Test Service"
+        mock_container = {
+            "Id": "abc123",
+            "Names": ["/test-service"],
+            "Labels": {
+                "traefik.http.routers.test1.rule": "Host(`test1.example.com`)",
+                "traefik.http.routers.test2.rule": "Host(`test2.example.com`)",
+                "traefik.http.routers.test3.rule": "Host(`test3.example.com`)",
+                "com.docker.compose.service": "test-service",
+                "traefik-home.enable": "true",  # Must have traefik-home labels to be included
+                "traefik-home.alias": "Test Service"
+            }
         }
-        mock_docker_client.containers.list.return_value = [mock_container]
+        mock_docker_client.api.containers.return_value = [mock_container]
         
         # Patch sys.argv and docker.from_env
         monkeypatch.setattr(sys, "argv", [
@@ -151,7 +232,7 @@ class TestCLIIntegration:
         
         # Mock Docker client
         mock_docker_client = Mock()
-        mock_docker_client.containers.list.return_value = []
+        mock_docker_client.api.containers.return_value = []
         
         # Patch sys.argv and docker.from_env
         monkeypatch.setattr(sys, "argv", [
@@ -169,6 +250,93 @@ class TestCLIIntegration:
         content = home_html.read_text()
         assert content == template_content
     
+    def test_main_exits_when_default_template_is_missing(self, tmp_path, monkeypatch, capsys):
+        """Test that a missing fallback page is reported instead of crashing"""
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        
+        mock_docker_client = Mock()
+        mock_docker_client.api.containers.return_value = []
+        
+        monkeypatch.setattr(sys, "argv", [
+            "generate_page.py",
+            "--output-dir", str(output_dir),
+            "--template", "/nonexistent/home.tmpl",
+            "--overrides", "/nonexistent/overrides.json"
+        ])
+        monkeypatch.setattr(generate_page, "DEFAULT_CLIENT_HTML_PATH", tmp_path / "missing.html")
+        generate_page._default_client_html_bytes.cache_clear()
+        
+        try:
+            with patch("generate_page.docker.from_env", return_value=mock_docker_client):
+                with pytest.raises(SystemExit) as exc_info:
+                    generate_page.main()
+        finally:
+            generate_page._default_client_html_bytes.cache_clear()
+        
+        assert exc_info.value.code == 1
+        assert "missing.html" in capsys.readouterr().err
+    
+    def test_main_inlines_apps_json_placeholder(self, tmp_path, monkeypatch):
+        """Test that {{APPS_JSON}} in a template is replaced with apps.json"""
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        
+        template_file = tmp_path / "inline.tmpl"
+        template_file.write_text("<script>const data = {{APPS_JSON}};</script>")
+        
+        mock_docker_client = Mock()
+        mock_docker_client.api.containers.return_value = []
+        
+        monkeypatch.setattr(sys, "argv", [
+            "generate_page.py",
+            "--output-dir", str(output_dir),
+            "--template", str(template_file),
+            "--overrides", "/nonexistent/overrides.json"
+        ])
+        monkeypatch.setenv("PAGE_TITLE", "</script><b>")
+        
+        with patch("generate_page.docker.from_env", return_value=mock_docker_client):
+            generate_page.main()
+        
+        content = (output_dir / "home.html").read_text()
+        inline = content[len("<script>const data = "):-len(";</script>")]
+        assert "</script><b>" not in inline
+        assert json.loads(inline) == json.loads((output_dir / "apps.json").read_text())
+    
+    def test_main_inlined_json_cannot_open_script_comment(self, tmp_path, monkeypatch):
+        """Test that "<!--<script>" in app data cannot swallow the page's scripts"""
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        
+        overrides_file = tmp_path / "overrides.json"
+        overrides_file.write_text(json.dumps({
+            "tricky": {
+                "Enable": True,
+                "Url": "http://tricky.local",
+                "Description": "<!--<script> & </script>"
+            }
+        }))
+        
+        mock_docker_client = Mock()
+        mock_docker_client.api.containers.return_value = []
+        
+        monkeypatch.setattr(sys, "argv", [
+            "generate_page.py",
+            "--output-dir", str(output_dir),
+            "--template", str(Path(__file__).parent.parent / "app" / "templates" / "home-client.tmpl"),
+            "--overrides", str(overrides_file)
+        ])
+        
+        with patch("generate_page.docker.from_env", return_value=mock_docker_client):
+            generate_page.main()
+        
+        content = (output_dir / "home.html").read_text()
+        start = content.index('<script type="application/json" id="apps-data">') + len('<script type="application/json" id="apps-data">')
+        inline = content[start:content.index("</script>", start)]
+        assert "<" not in inline and ">" not in inline and "&" not in inline
+        assert json.loads(inline)["apps"][0]["description"] == "<!--<script> & </script>"
+    
     def test_main_with_overrides_file(self, tmp_path, monkeypatch):
         """Test that main() applies overrides from file"""
         output_dir = tmp_path / "output"
@@ -187,14 +355,16 @@ class TestCLIIntegration:
         
         # Mock Docker client with traefik-home labels
         mock_docker_client = Mock()
-        mock_container = Mock()
-        mock_container.name = "test-service"
-        mock_container.labels = {
-            "traefik.http.routers.test.rule": "Host(`test.example.com`)",
-            "com.docker.compose.service": "test-service",
-            "traefik-home.enable": "true"  # Must have traefik-home labels to be included
+        mock_container = {
+            "Id": "abc123",
+            "Names": ["/test-service"],
+            "Labels": {
+                "traefik.http.routers.test.rule": "Host(`test.example.com`)",
+                "com.docker.compose.service": "test-service",
+                "traefik-home.enable": "true"  # Must have traefik-home labels to be included
+            }
         }
-        mock_docker_client.containers.list.return_value = [mock_container]
+        mock_docker_client.api.containers.return_value = [mock_container]
         
         # Patch sys.argv and docker.from_env
         monkeypatch.setattr(sys, "argv", [
@@ -217,6 +387,41 @@ class TestCLIIntegration:
         assert app["icon"] == "🚀"
         assert app["category"] == "Testing"
 
+    
+    def test_main_verbose_prints_app_list(self, tmp_path, monkeypatch, capsys):
+        """Test that the app list is only printed with --verbose"""
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        
+        mock_docker_client = Mock()
+        mock_docker_client.api.containers.return_value = [{
+            "Id": "abc123",
+            "Names": ["/test-service"],
+            "Labels": {
+                "traefik.http.routers.test.rule": "Host(`test.example.com`)",
+                "com.docker.compose.service": "test-service",
+                "traefik-home.enable": "true"
+            }
+        }]
+        
+        argv = [
+            "generate_page.py",
+            "--output-dir", str(output_dir),
+            "--overrides", "/nonexistent/overrides.json"
+        ]
+        
+        monkeypatch.setattr(sys, "argv", argv)
+        with patch("generate_page.docker.from_env", return_value=mock_docker_client):
+            generate_page.main()
+        assert "=== Apps List ===" not in capsys.readouterr().out
+        
+        monkeypatch.setattr(sys, "argv", argv + ["--verbose"])
+        with patch("generate_page.docker.from_env", return_value=mock_docker_client):
+            generate_page.main()
+        out = capsys.readouterr().out
+        assert "=== Apps List ===" in out
+        assert "  - Test Service: http://test.example.com (icon: no, category: Apps)" in out
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
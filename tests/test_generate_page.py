@@ -70,6 +70,40 @@ class TestParseTraefikRule:
         urls = generate_page.parse_traefik_rule(rule)
         assert urls == ["http://example.com"]
     
+    def test_parse_host_regexp(self):
+        """Test parsing HostRegexp() strips the regexp braces"""
+        rule = "HostRegexp(`{subdomain:[a-z]+}.example.com`)"
+        urls = generate_page.parse_traefik_rule(rule, protocol="https")
+        assert urls == ["https://subdomain:[a-z]+.example.com"]
+    
+    def test_parse_host_with_multiple_domains(self):
+        """Test the Traefik v2 multi-domain form Host(`a`, `b`)"""
+        rule = "Host(`a.example.com`, `b.example.com`)"
+        urls = generate_page.parse_traefik_rule(rule)
+        assert urls == ["http://a.example.com", "http://b.example.com"]
+    
+    def test_parse_host_regexp_with_parentheses(self):
+        """Test that parentheses inside a quoted HostRegexp pattern are kept"""
+        rule = "HostRegexp(`{sub:(a|b)}.example.com`)"
+        urls = generate_page.parse_traefik_rule(rule)
+        assert urls == ["http://sub:(a|b).example.com"]
+    
+    def test_parse_host_with_path(self):
+        """Test that non-Host matchers in the rule are ignored"""
+        rule = "Host(`example.com`) && PathPrefix(`/api`)"
+        urls = generate_page.parse_traefik_rule(rule)
+        assert urls == ["http://example.com"]
+    
+    def test_parse_rule_without_host(self):
+        """Test that rules without a Host matcher yield no URLs"""
+        assert generate_page.parse_traefik_rule("PathPrefix(`/api`)") == []
+    
+    def test_parse_traefik_hosts_deduplicates(self):
+        """Test that repeated hosts in one rule are returned once, in order"""
+        rule = "Host(`a.example.com`) || Host(`b.example.com`) || Host(`a.example.com`)"
+        hosts = generate_page.parse_traefik_hosts(rule)
+        assert hosts == ["a.example.com", "b.example.com"]
+    
     def test_parse_empty_rule(self):
         """Test parsing empty rule"""
         rule = ""
@@ -82,56 +116,109 @@ class TestBuildServiceUrlMap:
     
     def test_build_service_url_map_basic(self):
         """Test building URL map from Docker containers"""
-        # Mock Docker client
-        mock_client = Mock()
-        mock_container = Mock()
-        mock_container.name = "test-service"
-        mock_container.labels = {
-            "traefik.http.routers.test.rule": "Host(`test.example.com`)",
-            "com.docker.compose.service": "test-service"
+        # Raw container dict as returned by the Docker list endpoint
+        container = {
+            "Id": "abc123",
+            "Names": ["/test-service"],
+            "Labels": {
+                "traefik.http.routers.test.rule": "Host(`test.example.com`)",
+                "com.docker.compose.service": "test-service"
+            }
         }
-        mock_client.containers.list.return_value = [mock_container]
         
-        result, metadata = generate_page.build_service_url_map(mock_client)
+        result, metadata = generate_page.build_service_url_map([container])
         
         assert "test-service" in result
         assert "http://test.example.com" in result["test-service"]
     
     def test_build_service_url_map_skips_redirects(self):
         """Test that redirect routers are skipped"""
-        mock_client = Mock()
-        mock_container = Mock()
-        mock_container.name = "test-service"
-        mock_container.labels = {
-            "traefik.http.routers.test-redirect.rule": "Host(`test.example.com`)",
-            "traefik.http.routers.test.rule": "Host(`test.example.com`)",
-            "com.docker.compose.service": "test-service"
+        container = {
+            "Id": "abc123",
+            "Names": ["/test-service"],
+            "Labels": {
+                "traefik.http.routers.test-redirect.rule": "Host(`test.example.com`)",
+                "traefik.http.routers.test.rule": "Host(`test.example.com`)",
+                "com.docker.compose.service": "test-service"
+            }
         }
-        mock_client.containers.list.return_value = [mock_container]
         
-        result, metadata = generate_page.build_service_url_map(mock_client)
+        result, metadata = generate_page.build_service_url_map([container])
         
         # Should have one URL, not two (redirect should be skipped)
         assert len(result["test-service"]) == 1
     
     def test_build_service_url_map_removes_duplicates(self):
         """Test that duplicate URLs are removed"""
-        mock_client = Mock()
-        mock_container = Mock()
-        mock_container.name = "test-service"
-        mock_container.labels = {
-            "traefik.http.routers.test1.rule": "Host(`test.example.com`)",
-            "traefik.http.routers.test2.rule": "Host(`test.example.com`)",
-            "com.docker.compose.service": "test-service"
+        container = {
+            "Id": "abc123",
+            "Names": ["/test-service"],
+            "Labels": {
+                "traefik.http.routers.test1.rule": "Host(`test.example.com`)",
+                "traefik.http.routers.test2.rule": "Host(`test.example.com`)",
+                "com.docker.compose.service": "test-service"
+            }
         }
-        mock_client.containers.list.return_value = [mock_container]
         
-        result, metadata = generate_page.build_service_url_map(mock_client)
+        result, metadata = generate_page.build_service_url_map([container])
         
         # Should have one unique URL
         assert len(result["test-service"]) == 1
         assert "http://test.example.com" in result["test-service"]
 
+    
+    def test_build_service_url_map_websecure_entrypoint(self):
+        """Test that routers on the websecure entrypoint get https URLs"""
+        container = {
+            "Id": "abc123",
+            "Names": ["/test-service"],
+            "Labels": {
+                "traefik.http.routers.test.rule": "Host(`test.example.com`)",
+                "traefik.http.routers.test.entrypoints": "websecure",
+                "traefik.http.routers.test-local.rule": "Host(`test.local`)",
+                "com.docker.compose.service": "test-service"
+            }
+        }
+        
+        result, metadata = generate_page.build_service_url_map([container])
+        
+        assert result["test-service"] == ["https://test.example.com", "http://test.local"]
+        assert result["test@docker"] == ["https://test.example.com"]
+    
+    def test_build_service_url_map_insecure_entrypoint_stays_http(self):
+        """Test that an entrypoint merely containing "secure" does not imply https"""
+        container = {
+            "Id": "abc123",
+            "Names": ["/test-service"],
+            "Labels": {
+                "traefik.http.routers.test.rule": "Host(`test.example.com`)",
+                "traefik.http.routers.test.entrypoints": "web-insecure",
+                "com.docker.compose.service": "test-service"
+            }
+        }
+        
+        result, metadata = generate_page.build_service_url_map([container])
+        
+        assert result["test-service"] == ["http://test.example.com"]
+    
+    def test_build_service_url_map_merges_traefik_api_routers(self):
+        """Test that Traefik API routers come first and Docker URLs are merged in"""
+        container = {
+            "Id": "abc123",
+            "Names": ["/omv"],
+            "Labels": {
+                "traefik.http.routers.omv.rule": "Host(`omv.example.com`)",
+                "com.docker.compose.service": "omv"
+            }
+        }
+        traefik_urls = {"omv": ["http://omv.locker.local"], "omv@file": ["http://omv.locker.local"]}
+        
+        with patch.object(generate_page, "fetch_traefik_routers", return_value=traefik_urls):
+            result, metadata = generate_page.build_service_url_map([container], "http://traefik:8080")
+        
+        assert result["omv"] == ["http://omv.locker.local", "http://omv.example.com"]
+        assert result["omv@file"] == ["http://omv.locker.local"]
+
 
 class TestBuildAppList:
     """Tests for build_app_list function"""
@@ -340,10 +427,12 @@ class TestExternalApps:
     
     def test_get_external_apps_from_labels(self):
         """Test parsing external app labels from traefik-home container"""
-        # Mock Docker client
-        mock_client = Mock()
-        mock_container = Mock()
-        mock_container.labels = {
+        # Raw traefik-home container dict
+        container = {
+            "Id": "test-container-id-full",
+            "Names": ["/traefik-home"],
+        }
+        container["Labels"] = {
             "traefik-home.app.router.enable": "true",
             "traefik-home.app.router.alias": "Home Router",
             "traefik-home.app.router.url": "http://192.168.1.1",
@@ -358,11 +447,7 @@ class TestExternalApps:
             "traefik-home.app.disabled-app.url": "http://disabled.local"
         }
         
-        # Mock environment variable
-        with patch.dict(os.environ, {"HOSTNAME": "test-container-id"}):
-            mock_client.containers.get.return_value = mock_container
-            
-            result = generate_page.get_external_apps_from_labels(mock_client)
+        result = generate_page.get_external_apps_from_labels(container)
         
         # Should have 3 apps parsed (router, nas, disabled-app)
         assert len(result) == 3
@@ -387,6 +472,23 @@ class TestExternalApps:
         assert "disabled-app" in result
         assert result["disabled-app"]["enabled"] == False
     
+    def test_external_app_multiple_url_labels(self):
+        """Test that suffixed .url labels (e.g. .url.1, .url.2) all contribute URLs"""
+        container = {
+            "Id": "test-container-id-full",
+            "Names": ["/traefik-home"],
+            "Labels": {
+                "traefik-home.app.nas.enable": "true",
+                "traefik-home.app.nas.url": "http://zero",
+                "traefik-home.app.nas.url.1": "http://one",
+                "traefik-home.app.nas.url.2": "http://two"
+            }
+        }
+        
+        result = generate_page.get_external_apps_from_labels(container)
+        
+        assert sorted(result["nas"]["urls"]) == ["http://one", "http://two", "http://zero"]
+    
     def test_docker_and_external_apps_integration(self):
         """
         Test complete integration: Docker app + External app with all labels.
@@ -510,16 +612,182 @@ class TestExternalApps:
         assert apps[0]["urls"] == ["http://valid.local"]
 
 
+class TestSelfContainer:
+    """Tests for locating the traefik-home container in the container list"""
+    
+    def test_find_self_container_by_id_prefix(self):
+        """Test that HOSTNAME matches the container by short ID prefix"""
+        containers = [
+            {"Id": "aaaa1111", "Names": ["/other"], "Labels": {}},
+            {"Id": "bbbb2222cccc", "Names": ["/traefik-home"], "Labels": {}}
+        ]
+        
+        with patch.dict(os.environ, {"HOSTNAME": "bbbb2222"}):
+            result = generate_page.find_self_container(containers)
+        
+        assert result is containers[1]
+    
+    def test_find_self_container_not_found(self):
+        """Test that a missing traefik-home container returns None"""
+        containers = [{"Id": "aaaa1111", "Names": ["/other"], "Labels": {}}]
+        
+        with patch.dict(os.environ, {"HOSTNAME": "zzzz"}):
+            assert generate_page.find_self_container(containers) is None
+    
+    def test_get_config_from_self_container_labels(self):
+        """Test that config labels are read from the already-located container"""
+        container = {
+            "Id": "bbbb2222cccc",
+            "Names": ["/traefik-home"],
+            "Labels": {
+                "traefik-home.show-footer": "false",
+                "traefik-home.sort-by": "name"
+            }
+        }
+        
+        config = generate_page.get_config_from_env_and_labels(container)
+        
+        assert config["show_footer"] == False
+        assert config["sort_by"] == "name"
+
+
+class TestWatchMode:
+    """Tests for Docker event handling in --watch mode"""
+    
+    def test_start_event_fetches_only_that_container(self):
+        """Test that a start event re-fetches just the affected container"""
+        mock_client = Mock()
+        new_container = {"Id": "new123", "Names": ["/new"], "Labels": {}}
+        mock_client.api.containers.return_value = [new_container]
+        containers_by_id = {}
+        
+        event = {"Type": "container", "Action": "start", "id": "new123"}
+        changed = generate_page.apply_container_event(mock_client, containers_by_id, event)
+        
+        assert changed
+        assert containers_by_id == {"new123": new_container}
+        mock_client.api.containers.assert_called_once_with(filters={"id": "new123"})
+    
+    def test_update_event_with_same_labels_is_ignored(self):
+        """Test that re-fetching an unchanged container does not trigger regeneration"""
+        mock_client = Mock()
+        container = {"Id": "abc123", "Names": ["/app"], "Labels": {"traefik-home.enable": "true"}}
+        mock_client.api.containers.return_value = [dict(container, State="running")]
+        containers_by_id = {"abc123": container}
+        
+        event = {"Type": "container", "Action": "update", "id": "abc123"}
+        assert not generate_page.apply_container_event(mock_client, containers_by_id, event)
+        
+        mock_client.api.containers.return_value = [dict(container, Labels={"traefik-home.enable": "false"})]
+        assert generate_page.apply_container_event(mock_client, containers_by_id, event)
+    
+    def test_rename_event_triggers_regeneration(self):
+        """Test that renaming a container is picked up, since names feed the page"""
+        mock_client = Mock()
+        container = {"Id": "abc123", "Names": ["/old-name"], "Labels": {}}
+        mock_client.api.containers.return_value = [dict(container, Names=["/new-name"])]
+        containers_by_id = {"abc123": container}
+        
+        event = {"Type": "container", "Action": "rename", "id": "abc123"}
+        assert generate_page.apply_container_event(mock_client, containers_by_id, event)
+        assert containers_by_id["abc123"]["Names"] == ["/new-name"]
+    
+    def test_sigterm_exits_cleanly(self):
+        """Test that the SIGTERM handler exits with status 0"""
+        with pytest.raises(SystemExit) as exc_info:
+            generate_page._exit_on_sigterm(15, None)
+        assert exc_info.value.code == 0
+    
+    def test_die_event_drops_container(self):
+        """Test that a die event removes the container without API calls"""
+        mock_client = Mock()
+        containers_by_id = {"old123": {"Id": "old123", "Names": ["/old"], "Labels": {}}}
+        
+        event = {"Type": "container", "Action": "die", "id": "old123"}
+        changed = generate_page.apply_container_event(mock_client, containers_by_id, event)
+        
+        assert changed
+        assert containers_by_id == {}
+        mock_client.api.containers.assert_not_called()
+    
+    def test_irrelevant_event_ignored(self):
+        """Test that events outside WATCH_EVENTS do not trigger regeneration"""
+        mock_client = Mock()
+        event = {"Type": "container", "Action": "exec_start", "id": "abc"}
+        
+        assert not generate_page.apply_container_event(mock_client, {}, event)
+    
+    def test_events_are_replayed_from_listing_time(self):
+        """Test that event subscriptions start from before each container listing"""
+        mock_client = Mock()
+        mock_client.events.return_value = iter([])
+        mock_client.api.containers.return_value = []
+        args = Mock()
+        
+        # Stop the watch loop after the first resynchronisation
+        with patch.object(generate_page.time, "sleep", side_effect=[None, KeyboardInterrupt]), \
+                patch.object(generate_page.time, "time", return_value=200.5):
+            with pytest.raises(KeyboardInterrupt):
+                generate_page.watch_docker_events(mock_client, args, [], None, since=100)
+        
+        assert [c.kwargs["since"] for c in mock_client.events.call_args_list] == [100, 200]
+    
+    def test_failed_generation_is_retried(self):
+        """Test that a failed regeneration is retried after resyncing, despite unchanged containers"""
+        mock_client = Mock()
+        container = {"Id": "new123", "Names": ["/new"], "Labels": {}}
+        mock_client.events.side_effect = [
+            iter([{"Type": "container", "Action": "start", "id": "new123"}]),
+            iter([]),
+        ]
+        mock_client.api.containers.return_value = [container]
+        args = Mock()
+        
+        with patch.object(generate_page, "generate", side_effect=[OSError("disk full"), None]) as mock_generate, \
+                patch.object(generate_page.time, "sleep", side_effect=[None, KeyboardInterrupt]):
+            with pytest.raises(KeyboardInterrupt):
+                generate_page.watch_docker_events(mock_client, args, [], "http://traefik:8080")
+        
+        assert mock_generate.call_count == 2
+    
+    def test_traefik_discovery_is_retried_on_regeneration(self):
+        """Test that an undiscovered Traefik API is looked up again before regenerating"""
+        mock_client = Mock()
+        container = {"Id": "new123", "Names": ["/new"], "Labels": {}}
+        mock_client.events.return_value = iter([{"Type": "container", "Action": "start", "id": "new123"}])
+        mock_client.api.containers.return_value = [container]
+        args = Mock()
+        
+        with patch.object(generate_page, "discover_traefik_api", return_value="http://traefik:8080"), \
+                patch.object(generate_page, "generate") as mock_generate, \
+                patch.object(generate_page.time, "sleep", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                generate_page.watch_docker_events(mock_client, args, [], None)
+        
+        mock_generate.assert_called_once_with(args, [container], "http://traefik:8080")
+
+
 class TestTraefikAPIDiscovery:
     """Tests for Traefik API router discovery"""
     
+    def test_discover_traefik_api_prefers_earlier_candidates(self, monkeypatch):
+        """Test that concurrent probing still returns candidates in preference order"""
+        monkeypatch.delenv("TRAEFIK_API_URL", raising=False)
+        reachable = {"http://localhost:8080", "http://traefik-proxy:8081"}
+        
+        with patch.object(generate_page, "test_traefik_endpoint", side_effect=lambda url: url in reachable):
+            assert generate_page.discover_traefik_api() == "http://traefik-proxy:8081"
+        
+        with patch.object(generate_page, "test_traefik_endpoint", return_value=False):
+            assert generate_page.discover_traefik_api() is None
+    
     def test_fetch_traefik_routers_list_format(self):
         """Test fetching routers from Traefik API (list format)"""
-        # Mock requests module
+        # Mock the shared HTTP session
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = [
+        mock_response.content = json.dumps([
             {
                 "name": "omv@file",
                 "entryPoints": ["web"],
@@ -534,9 +802,9 @@ class TestTraefikAPIDiscovery:
                 "service": "rclone",
                 "status": "enabled"
             }
-        ]
+        ]).encode()
         
-        with patch.object(generate_page.requests, 'get', return_value=mock_response):
+        with patch.object(generate_page._SESSION, 'get', return_value=mock_response):
             result = generate_page.fetch_traefik_routers("http://traefik:8080")
         
         # Should have URLs for both routers
@@ -553,7 +821,7 @@ class TestTraefikAPIDiscovery:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = [
+        mock_response.content = json.dumps([
             {
                 "name": "traefik-ui@file",
                 "entryPoints": ["web"],
@@ -561,9 +829,9 @@ class TestTraefikAPIDiscovery:
                 "service": "api@internal",
                 "status": "enabled"
             }
-        ]
+        ]).encode()
         
-        with patch.object(generate_page.requests, 'get', return_value=mock_response):
+        with patch.object(generate_page._SESSION, 'get', return_value=mock_response):
             result = generate_page.fetch_traefik_routers("http://traefik:8080")
         
         # Should be stored under full router name and base name
@@ -615,6 +883,111 @@ class TestTraefikAPIDiscovery:
         assert rclone_app["category"] == "Admin"
 
 
+class TestLoadTemplate:
+    """Tests for load_template_bytes function"""
+    
+    def test_load_template_missing_file(self, tmp_path):
+        """Test that a missing template returns None"""
+        assert generate_page.load_template_bytes(str(tmp_path / "missing.tmpl")) is None
+    
+    def test_load_template_reloads_after_change(self, tmp_path):
+        """Test that cached template content is refreshed when the file changes"""
+        template_file = tmp_path / "home.tmpl"
+        template_file.write_text("<html>v1</html>")
+        assert generate_page.load_template_bytes(str(template_file)) == b"<html>v1</html>"
+        
+        template_file.write_text("<html>version 2</html>")
+        assert generate_page.load_template_bytes(str(template_file)) == b"<html>version 2</html>"
+    
+    def test_default_template_is_shipped(self):
+        """Test that the fallback page exists and has the apps.json placeholder"""
+        content = generate_page.DEFAULT_CLIENT_HTML_PATH.read_bytes()
+        assert generate_page.APPS_JSON_PLACEHOLDER in content
+
+
+class TestDumpJson:
+    """Tests for dump_json function"""
+    
+    def test_dump_json_round_trip(self):
+        """Test that dump_json output parses back to the same data"""
+        data = {"apps": [{"name": "Test", "icon": "🚀"}]}
+        assert json.loads(generate_page.dump_json(data)) == data
+    
+    def test_dump_json_compact_by_default(self):
+        """Test that output is compact unless pretty is requested"""
+        data = {"apps": [{"name": "Test"}]}
+        for orjson_module in (generate_page.orjson, None):
+            with patch.object(generate_page, "orjson", orjson_module):
+                assert generate_page.dump_json(data) == b'{"apps":[{"name":"Test"}]}'
+                assert b"\n  " in generate_page.dump_json(data, pretty=True)
+    
+    def test_dump_json_without_orjson(self):
+        """Test the stdlib json fallback returns encoded bytes"""
+        data = {"apps": [{"name": "Test"}]}
+        with patch.object(generate_page, "orjson", None):
+            result = generate_page.dump_json(data)
+        assert isinstance(result, bytes)
+        assert json.loads(result) == data
+
+    
+    def test_dump_json_stringifies_unknown_types(self):
+        """Test that non-JSON values are serialized as strings instead of failing"""
+        data = {"path": Path("/tmp/x")}
+        assert json.loads(generate_page.dump_json(data)) == {"path": "/tmp/x"}
+        with patch.object(generate_page, "orjson", None):
+            assert json.loads(generate_page.dump_json(data)) == {"path": "/tmp/x"}
+    
+    def test_dump_apps_json_matches_full_document(self):
+        """Test that the spliced apps.json parses to the full document"""
+        config = {"page_title": "Home", "show_footer": True}
+        apps = [{"name": "Test", "urls": ["http://test.local"]}]
+        expected = {
+            "_generated": "2024-01-01T00:00:00+00:00",
+            "config": config,
+            "apps": apps,
+            "categories": [{"name": "Apps", "apps": [0]}],
+        }
+        
+        for pretty in (False, True):
+            result = generate_page.dump_apps_json(expected["_generated"], config, apps, pretty=pretty)
+            assert json.loads(result) == expected
+    
+    def test_build_apps_json_keeps_timestamp_until_content_changes(self, tmp_path):
+        """Test that _generated is only refreshed when the config or apps change"""
+        apps_json_path = tmp_path / "apps.json"
+        config = {"page_title": "Home"}
+        apps = [{"name": "Test", "urls": ["http://test.local"]}]
+        apps_json_path.write_bytes(generate_page.dump_apps_json("2024-01-01T00:00:00Z", config, apps))
+        
+        result = generate_page.build_apps_json(str(apps_json_path), config, apps)
+        assert result == apps_json_path.read_bytes()
+        
+        result = generate_page.build_apps_json(str(apps_json_path), config, apps + [{"name": "New", "urls": []}])
+        assert json.loads(result)["_generated"] != "2024-01-01T00:00:00Z"
+        
+        result = generate_page.build_apps_json(str(tmp_path / "missing.json"), config, apps)
+        assert json.loads(result)["apps"] == apps
+
+
+class TestGroupAppsByCategory:
+    """Tests for group_apps_by_category function"""
+    
+    def test_groups_sorted_by_category_with_app_indices(self):
+        """Test that categories are sorted and keep the app list order"""
+        apps = [
+            {"name": "Alpha", "category": "Media"},
+            {"name": "Beta", "category": "Admin"},
+            {"name": "Gamma", "category": ""},
+            {"name": "Delta", "category": "Media"},
+        ]
+        
+        assert generate_page.group_apps_by_category(apps) == [
+            {"name": "Admin", "apps": [1]},
+            {"name": "Apps", "apps": [2]},
+            {"name": "Media", "apps": [0, 3]},
+        ]
+
+
 class TestLoadOverrides:
     """Tests for load_overrides function"""
     
@@ -633,6 +1006,26 @@ class TestLoadOverrides:
         
         assert result == overrides_data
     
+    def test_load_overrides_without_orjson(self, tmp_path):
+        """Test loading overrides with the stdlib json fallback"""
+        override_file = tmp_path / "overrides.json"
+        overrides_data = {"test-service": {"Name": "Test Service"}}
+        override_file.write_text(json.dumps(overrides_data))
+        
+        with patch.object(generate_page, "orjson", None):
+            result = generate_page.load_overrides(str(override_file))
+        
+        assert result == overrides_data
+    
+    def test_load_overrides_reloads_after_change(self, tmp_path):
+        """Test that cached overrides are refreshed when the file changes"""
+        override_file = tmp_path / "overrides.json"
+        override_file.write_text(json.dumps({"a": {"Name": "A"}}))
+        assert generate_page.load_overrides(str(override_file)) == {"a": {"Name": "A"}}
+        
+        override_file.write_text(json.dumps({"b": {"Name": "Service B"}}))
+        assert generate_page.load_overrides(str(override_file)) == {"b": {"Name": "Service B"}}
+    
     def test_load_overrides_file_not_exists(self):
         """Test loading overrides when file doesn't exist"""
         result = generate_page.load_overrides("/nonexistent/file.json")